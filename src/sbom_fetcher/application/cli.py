@@ -4,16 +4,17 @@ import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 
-def parse_arguments() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
     Preserves exact CLI interface from original script.
 
     Returns:
-        Parsed arguments
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description="API-based GitHub SBOM dependency fetcher",
@@ -45,10 +46,27 @@ Examples:
     parser.add_argument("--output-dir", default="sboms", help="Base output directory")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import; parse_args() does not modify the parser
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    return _PARSER.parse_args(argv)
 
 
-def setup_logging(debug: bool = False) -> None:
+def setup_logging(debug: bool = False, log_dir: Optional[Path] = None) -> None:
     """
     Setup logging configuration.
 
@@ -56,11 +74,12 @@ def setup_logging(debug: bool = False) -> None:
 
     Args:
         debug: Enable debug logging
+        log_dir: Directory for the log file (defaults to docs/logs)
     """
     log_level = logging.DEBUG if debug else logging.INFO
 
     # Create logs directory if it doesn't exist
-    log_dir = Path("docs/logs")
+    log_dir = Path(log_dir) if log_dir is not None else Path("docs/logs")
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate timestamped log filename
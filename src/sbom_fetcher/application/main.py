@@ -1,13 +1,24 @@
 """Main application entry point with dependency injection."""
 
+import hashlib
 import json
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..domain.exceptions import TokenLoadError
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None
+
+from ..domain.exceptions import InvalidConfigError, TokenLoadError
 from ..infrastructure.config import Config
 from ..infrastructure.filesystem import FilesystemSBOMRepository
 from ..services.github_client import GitHubClient
@@ -18,10 +29,20 @@ from ..services.sbom_service import SBOMFetcherService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _read_keys_file(path: str, stamp: Tuple[int, int, int]) -> Dict[str, Any]:
+    """Parse a keys file; cached per path and (mtime_ns, size, inode) stamp."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_token(key_file: Path, account: str = None) -> str:
     """
     Load GitHub token from keys file for specified account.
 
+    The parsed file is cached until its modification time, size or inode
+    changes, so looking up several accounts reads it once.
+
     Args:
         key_file: Path to keys.json file
         account: Account username to look up (e.g., 'tedg-dev', 'tedg-cisco')
@@ -33,8 +54,8 @@ def load_token(key_file: Path, account: str = None) -> str:
         TokenLoadError: If token cannot be loaded
     """
     try:
-        with open(key_file, "r") as f:
-            data = json.load(f)
+        st = os.stat(key_file)
+        data = _read_keys_file(str(key_file), (st.st_mtime_ns, st.st_size, st.st_ino))
 
         # If account specified, search accounts array
         if account:
@@ -73,19 +94,85 @@ def load_token(key_file: Path, account: str = None) -> str:
         raise TokenLoadError(f"Invalid JSON in keys file '{key_file}'")
 
 
-def build_session(token: str) -> requests.Session:
+class _GitHubRetry(Retry):
+    """Retry policy that also honours Retry-After on 403 secondary rate limits."""
+
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES | frozenset({403})
+
+
+def _retry_policy(max_retries: int) -> Retry:
+    """
+    Build the urllib3 retry policy for GitHub API sessions.
+
+    Retries GETs on 429 and 5xx responses with jittered exponential backoff,
+    honouring Retry-After. A 403 is retried only when it carries Retry-After,
+    which is how GitHub signals a secondary rate limit. The final response is
+    returned rather than raised so callers can classify the failure.
+    """
+    kwargs: Dict[str, Any] = {
+        "total": max_retries,
+        "backoff_factor": 1.0,
+        "status_forcelist": (429, 500, 502, 503, 504),
+        "allowed_methods": frozenset({"GET"}),
+        "respect_retry_after_header": True,
+        "raise_on_status": False,
+    }
+    try:
+        return _GitHubRetry(backoff_jitter=0.3, **kwargs)
+    except TypeError:  # pragma: no cover - urllib3 < 2.0 has no jitter
+        return _GitHubRetry(**kwargs)
+
+
+def build_session(
+    token: str,
+    cache_dir: Optional[Path] = None,
+    max_retries: int = 2,
+    pool_size: int = 10,
+) -> requests.Session:
     """
     Build requests session with GitHub authentication.
 
-    Preserves exact behavior from original build_session function.
+    Preserves exact behavior from original build_session function. When
+    cache_dir is given and requests-cache is installed, responses are kept in
+    an on-disk SQLite cache so re-runs revalidate with ETags instead of
+    downloading every SBOM again. Each token gets its own cache database, so
+    a response fetched with one account is never served to another.
+    Transient failures are retried by the transport adapter (see
+    _retry_policy). All requests go to api.github.com, so the adapter keeps a
+    single host pool sized for the download workers.
 
     Args:
         token: GitHub API token
+        cache_dir: Optional directory for the persistent HTTP cache
+        max_retries: Retries per request on 429/5xx and connection errors
+        pool_size: Keep-alive connections held open per host
 
     Returns:
         Configured requests.Session
     """
-    s = requests.Session()
+    if cache_dir is not None and requests_cache is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # requests-cache strips Authorization from cache keys, so keep one
+        # database per token to stop one account's responses reaching another.
+        token_id = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        s = requests_cache.CachedSession(
+            str(cache_dir / f"http_cache_{token_id}"),
+            backend="sqlite",
+            expire_after=1800,
+            cache_control=True,
+        )
+    else:
+        if cache_dir is not None:
+            logger.warning("requests-cache is not installed; HTTP cache disabled")
+        s = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=_retry_policy(max_retries),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update(
         {
             "Authorization": f"token {token}",
@@ -169,7 +256,9 @@ def main() -> int:
         token = load_token(config.key_file, args.account)
 
         # Build session
-        session = build_session(token)
+        session = build_session(
+            token, config.http_cache_dir, config.max_retries, pool_size=config.max_workers
+        )
 
         # Create service with root org for internal package lookup
         service = create_service(config, token, root_org=args.gh_user)
@@ -188,6 +277,9 @@ def main() -> int:
     except TokenLoadError as e:
         logger.error("❌ Token error: %s", e)
         return 1
+    except InvalidConfigError as e:
+        logger.error("❌ Configuration error: %s", e)
+        return 1
     except Exception as e:
         logger.error("❌ Fatal error: %s", e, exc_info=args.debug if "args" in locals() else False)
         return 1
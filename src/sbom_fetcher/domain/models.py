@@ -1,10 +1,14 @@
 """Core domain models for SBOM fetcher."""
 
+import sys
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ErrorType(str, Enum):
     """Classification of error types."""
@@ -31,7 +35,7 @@ class GitHubRepository:
             raise ValueError("Owner and repo must be non-empty strings")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PackageDependency:
     """Represents a package dependency from SBOM."""
 
@@ -41,6 +45,8 @@ class PackageDependency:
     ecosystem: str
     github_repository: Optional[GitHubRepository] = None
     sbom_downloaded: bool = False
+    sbom_file: Optional[str] = None
+    sbom_component_count: int = 0
     error: Optional[str] = None
     error_type: Optional[ErrorType] = None
 
@@ -54,7 +60,7 @@ class PackageDependency:
             raise ValueError("Ecosystem cannot be empty")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FetcherStats:
     """Track statistics for the fetching process."""
 
@@ -66,7 +72,7 @@ class FetcherStats:
     sboms_failed_transient: int = 0
     duplicates_skipped: int = 0
     packages_without_github: int = 0
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
 
     @property
     def sboms_failed(self) -> int:
@@ -75,7 +81,7 @@ class FetcherStats:
 
     def elapsed_time(self) -> str:
         """Get elapsed time as formatted string."""
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         mins, secs = divmod(int(elapsed), 60)
         return f"{mins}m {secs}s" if mins > 0 else f"{secs}s"
 
@@ -20,11 +20,13 @@ class Config:
     # File paths
     output_dir: Path = field(default_factory=lambda: Path("sboms"))
     key_file: Path = field(default_factory=lambda: Path("keys.json"))
+    http_cache_dir: Optional[Path] = None
 
     # Behavior
     max_retries: int = 2
     timeout: int = 30
     rate_limit_pause: float = 0.5
+    max_workers: int = 8
 
     # Logging
     log_level: str = "INFO"
@@ -41,9 +43,11 @@ class Config:
             "SBOM_FETCHER_PYPI_API_URL": ("pypi_api_url", str),
             "SBOM_FETCHER_OUTPUT_DIR": ("output_dir", Path),
             "SBOM_FETCHER_KEY_FILE": ("key_file", Path),
+            "SBOM_FETCHER_HTTP_CACHE_DIR": ("http_cache_dir", Path),
             "SBOM_FETCHER_MAX_RETRIES": ("max_retries", int),
             "SBOM_FETCHER_TIMEOUT": ("timeout", int),
             "SBOM_FETCHER_RATE_LIMIT_PAUSE": ("rate_limit_pause", float),
+            "SBOM_FETCHER_MAX_WORKERS": ("max_workers", int),
             "SBOM_FETCHER_LOG_LEVEL": ("log_level", str),
         }
 
@@ -73,13 +77,17 @@ class Config:
             config_file: Optional config file (not implemented yet, for future use)
 
         Returns:
-            Configured instance
+            Configured, validated instance
+
+        Raises:
+            InvalidConfigError: If a value cannot be parsed or is out of range
         """
         # Start with env vars (which will use defaults if not set)
         config = cls.from_env()
 
         # Future: could load from YAML/TOML file here if config_file provided
 
+        config.validate()
         return config
 
     def validate(self) -> None:
@@ -90,3 +98,5 @@ class Config:
             raise InvalidConfigError("timeout must be positive")
         if self.rate_limit_pause < 0:
             raise InvalidConfigError("rate_limit_pause must be non-negative")
+        if self.max_workers < 1:
+            raise InvalidConfigError("max_workers must be at least 1")
@@ -1,11 +1,11 @@
 """Filesystem operations using Repository pattern."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional, Protocol
 
 from ..domain.exceptions import StorageError
+from .serialization import write_json
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +49,7 @@ class FilesystemSBOMRepository:
         filepath = target_dir / f"{identifier}.json"
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(sbom_data, f, indent=2)
+            write_json(filepath, sbom_data)
             logger.debug(f"Saved SBOM to {filepath}")
             return filepath
         except IOError as e:
@@ -61,8 +60,7 @@ class FilesystemSBOMRepository:
         filepath = self._base_dir / f"{identifier}.json"
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(mapping, f, indent=2)
+            write_json(filepath, mapping)
             logger.debug(f"Saved mapping to {filepath}")
             return filepath
         except IOError as e:
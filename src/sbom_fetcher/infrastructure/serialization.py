@@ -0,0 +1,50 @@
+"""JSON serialization with an optional orjson fast path."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+
+    Uses orjson when installed and falls back to the standard library
+    otherwise. Both paths produce two-space indentation and unescaped
+    non-ASCII characters, but the bytes are not identical: orjson formats
+    some floats differently (1e+16 vs 1e16). Data orjson rejects but the
+    standard library accepts, such as non-string dict keys or integers wider
+    than 64 bits, is serialized by the standard library instead.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        Encoded JSON document
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Retry with the more permissive standard library encoder
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data as indented JSON in a single write.
+
+    Args:
+        path: Destination file
+        data: JSON-compatible data
+    """
+    with open(path, "wb") as f:
+        f.write(dumps_json(data))
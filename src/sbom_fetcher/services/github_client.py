@@ -1,17 +1,56 @@
 """GitHub API client."""
 
+import json
 import logging
-import time
-from typing import Any, Dict, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
-from ..domain.models import ErrorType, PackageDependency
+from ..domain.models import ErrorType, GitHubRepository, PackageDependency
 from ..infrastructure.config import Config
 from ..infrastructure.http_client import HTTPClient
+from ..infrastructure.serialization import write_json
+from .parsers import count_sbom_components
 
 logger = logging.getLogger(__name__)
 
+# Fixed error messages for non-200 SBOM responses; other codes report "HTTP <code>"
+_STATUS_ERRORS: Dict[int, Tuple[str, ErrorType]] = {
+    403: ("Access forbidden", ErrorType.PERMANENT),
+    404: ("Dependency graph not enabled", ErrorType.PERMANENT),
+    429: ("Rate limited", ErrorType.TRANSIENT),
+}
+
+
+@lru_cache(maxsize=None)
+def _status_error(status: int) -> Tuple[str, ErrorType]:
+    """Classify a non-200 SBOM response; one shared result per status code."""
+    if status in _STATUS_ERRORS:
+        return _STATUS_ERRORS[status]
+    retryable = 500 <= status < 600
+    return f"HTTP {status}", ErrorType.TRANSIENT if retryable else ErrorType.PERMANENT
+
+
+def _graphql_url(api_url: str) -> str:
+    """
+    Derive the GraphQL endpoint from a REST API base URL.
+
+    github.com serves GraphQL at api.github.com/graphql, while GitHub
+    Enterprise Server serves REST at /api/v3 and GraphQL at /api/graphql.
+    """
+    base = api_url.rstrip("/")
+    if base.endswith("/v3"):
+        base = base[: -len("/v3")]
+    return f"{base}/graphql"
+
+
+def _is_rate_limited(resp: requests.Response) -> bool:
+    """Whether a 403 is GitHub throttling (secondary or exhausted primary limit)."""
+    return "Retry-After" in resp.headers or resp.headers.get("X-RateLimit-Remaining") == "0"
+
 
 class GitHubClient:
     """GitHub API client for SBOM operations."""
@@ -31,6 +70,7 @@ class GitHubClient:
         self._api_url = config.github_api_url
         self._sbom_api_template = f"{self._api_url}/repos/{{owner}}/{{repo}}/dependency-graph/sbom"
         self._repo_api_template = f"{self._api_url}/repos/{{owner}}/{{repo}}"
+        self._graphql_url = _graphql_url(self._api_url)
         self._branch_cache = {}  # Cache branch names to avoid repeated API calls
 
     def fetch_root_sbom(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
@@ -125,14 +165,63 @@ class GitHubClient:
         self._branch_cache[repo_key] = default
         return default
 
+    def prefetch_default_branches(
+        self, session: requests.Session, repos: List[GitHubRepository], chunk: int = 50
+    ) -> None:
+        """
+        Populate the branch cache for many repositories with batched GraphQL queries.
+
+        The SBOM export itself is REST-only, but default branch lookups can be
+        aliased into one GraphQL request per chunk instead of one REST call per
+        repository. A failed chunk is skipped without affecting the others.
+        Repositories missing from a response are left uncached so
+        get_default_branch falls back to its normal lookup.
+
+        Args:
+            session: Authenticated requests session
+            repos: Repositories to look up
+            chunk: Maximum repositories per GraphQL request
+        """
+        pending = [r for r in dict.fromkeys(repos) if str(r) not in self._branch_cache]
+
+        for start in range(0, len(pending), chunk):
+            batch = pending[start : start + chunk]
+            fields = " ".join(
+                f"r{i}: repository(owner: {json.dumps(r.owner)}, name: {json.dumps(r.repo)}) "
+                "{ defaultBranchRef { name } }"
+                for i, r in enumerate(batch)
+            )
+
+            try:
+                resp = session.post(
+                    self._graphql_url, json={"query": f"{{ {fields} }}"}, timeout=30
+                )
+                if resp.status_code != 200:
+                    logger.debug("GraphQL branch lookup returned HTTP %d", resp.status_code)
+                    continue
+                payload = resp.json()
+            except (requests.RequestException, ValueError) as e:
+                logger.debug(f"GraphQL branch lookup failed: {e}")
+                continue
+
+            data = payload.get("data")
+            if not data:
+                logger.debug("GraphQL branch lookup returned errors: %s", payload.get("errors"))
+                continue
+
+            for i, r in enumerate(batch):
+                ref = (data.get(f"r{i}") or {}).get("defaultBranchRef")
+                if ref and ref.get("name"):
+                    self._branch_cache[str(r)] = ref["name"]
+
     def download_dependency_sbom(
         self, session: requests.Session, pkg: PackageDependency, output_dir: str
     ) -> bool:
         """
         Download SBOM for a dependency's GitHub repository.
 
-        Preserves exact behavior from original including retry logic,
-        error types, and error messages.
+        Preserves error types and error messages from the original. Retries
+        are left to the session (see application.main.build_session).
 
         Args:
             session: Requests session (with auth headers)
@@ -143,6 +232,7 @@ class GitHubClient:
             True if successful, False otherwise (sets pkg.error and pkg.error_type)
         """
         if not pkg.github_repository:
+            # Defensive: the service only queues mapped packages
             pkg.error = "No GitHub repository mapped"
             return False
 
@@ -150,83 +240,94 @@ class GitHubClient:
             owner=pkg.github_repository.owner, repo=pkg.github_repository.repo
         )
 
-        max_retries = self._config.max_retries
+        # Retries for 429/5xx and connection errors happen in the session's
+        # transport adapter; whatever comes back here is final.
+        try:
+            resp = session.get(url, timeout=30)
+        except requests.RequestException as e:
+            pkg.error = str(e)
+            pkg.error_type = ErrorType.TRANSIENT
+            return False
 
-        for attempt in range(max_retries):
-            try:
-                resp = session.get(url, timeout=30)
-
-                if resp.status_code == 200:
-                    # Get default branch name for this repository
-                    import json
-                    import os
-
-                    branch = self.get_default_branch(
-                        session, pkg.github_repository.owner, pkg.github_repository.repo
-                    )
-                    # Sanitize branch name - replace slashes with underscores for valid filenames
-                    safe_branch = branch.replace("/", "_")
-                    filename = (
-                        f"{pkg.github_repository.owner}_"
-                        f"{pkg.github_repository.repo}_{safe_branch}.json"
-                    )
-                    filepath = os.path.join(output_dir, filename)
-
-                    # GitHub API returns {"sbom": {...SPDX content...}}
-                    # Extract just the SPDX content for standards-compliant output
-                    api_response = resp.json()
-                    sbom_content = api_response.get("sbom", api_response)
-
-                    with open(filepath, "w") as f:
-                        json.dump(sbom_content, f, indent=2)
-
-                    pkg.sbom_downloaded = True
-                    return True
-
-                elif resp.status_code == 404:
-                    pkg.error = "Dependency graph not enabled"
-                    pkg.error_type = ErrorType.PERMANENT
-                    return False
-                elif resp.status_code == 403:
-                    pkg.error = "Access forbidden"
-                    pkg.error_type = ErrorType.PERMANENT
-                    return False
-                elif resp.status_code == 429:
-                    # Rate limited
-                    if attempt < max_retries - 1:
-                        wait_time = 5 * (attempt + 1)
-                        logger.debug("Rate limited, waiting %ds...", wait_time)
-                        time.sleep(wait_time)
-                        continue
-                    pkg.error = "Rate limited"
-                    pkg.error_type = ErrorType.TRANSIENT
-                    return False
-                elif 500 <= resp.status_code < 600:
-                    # 5xx server errors are transient - retry
-                    if attempt < max_retries - 1:
-                        wait_time = 3 * (attempt + 1)
-                        logger.debug(
-                            "Server error %d, waiting %ds before retry...",
-                            resp.status_code,
-                            wait_time,
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    pkg.error = f"HTTP {resp.status_code}"
-                    pkg.error_type = ErrorType.TRANSIENT
-                    return False
-                else:
-                    # Other 4xx client errors are permanent
-                    pkg.error = f"HTTP {resp.status_code}"
-                    pkg.error_type = ErrorType.PERMANENT
-                    return False
-
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    time.sleep(2)
-                    continue
-                pkg.error = str(e)
-                pkg.error_type = ErrorType.TRANSIENT
-                return False
+        if resp.status_code != 200:
+            # GitHub throttles with 403 as well as 429; report both as rate limited
+            status = 429 if resp.status_code == 403 and _is_rate_limited(resp) else resp.status_code
+            pkg.error, pkg.error_type = _status_error(status)
+            return False
+
+        # Get default branch name for this repository
+        branch = self.get_default_branch(
+            session, pkg.github_repository.owner, pkg.github_repository.repo
+        )
+        # Sanitize branch name - replace slashes with underscores for valid filenames
+        safe_branch = branch.replace("/", "_")
+        filename = f"{pkg.github_repository.owner}_{pkg.github_repository.repo}_{safe_branch}.json"
+        filepath = os.path.join(output_dir, filename)
+
+        try:
+            # GitHub API returns {"sbom": {...SPDX content...}}
+            # Extract just the SPDX content for standards-compliant output
+            api_response = resp.json()
+            sbom_content = api_response.get("sbom", api_response)
+
+            write_json(filepath, sbom_content)
+            component_count = count_sbom_components(sbom_content)
+        except (ValueError, OSError) as e:
+            # Truncated or non-JSON bodies and write failures are worth retrying
+            pkg.error = str(e)
+            pkg.error_type = ErrorType.TRANSIENT
+            return False
+
+        pkg.sbom_downloaded = True
+        pkg.sbom_file = filename
+        pkg.sbom_component_count = component_count
+        return True
+
+    def download_dependency_sboms(
+        self,
+        session: requests.Session,
+        pkgs: List[PackageDependency],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        on_complete: Optional[Callable[[int, bool], None]] = None,
+    ) -> List[bool]:
+        """
+        Download SBOMs for several dependencies concurrently.
+
+        Each package goes through download_dependency_sbom, so retries and
+        error classification are unchanged. The worker pool is kept small to
+        stay clear of GitHub's secondary rate limits. An unexpected exception
+        fails only the package that raised it.
 
-        return False
+        Args:
+            session: Requests session (with auth headers)
+            pkgs: Package dependencies to download SBOMs for
+            output_dir: Directory to save SBOM files
+            max_workers: Pool size (defaults to config.max_workers)
+            on_complete: Called in the calling thread as each download
+                finishes, with the package's index in pkgs and its result
+
+        Returns:
+            Download results in the same order as pkgs
+        """
+        if not pkgs:
+            return []
+
+        results = [False] * len(pkgs)
+        workers = min(max_workers or self._config.max_workers, len(pkgs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.download_dependency_sbom, session, pkg, output_dir): i
+                for i, pkg in enumerate(pkgs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.debug(f"SBOM download for {pkgs[i].name} raised: {e}")
+                    pkgs[i].error = str(e) or type(e).__name__
+                    pkgs[i].error_type = ErrorType.UNKNOWN
+                if on_complete is not None:
+                    on_complete(i, results[i])
+        return results
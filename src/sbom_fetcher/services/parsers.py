@@ -9,6 +9,25 @@ from ..domain.models import PackageDependency
 logger = logging.getLogger(__name__)
 
 
+def count_sbom_components(sbom_data: Dict[str, Any]) -> int:
+    """
+    Count the number of components/packages in an SBOM.
+
+    Args:
+        sbom_data: SBOM JSON data
+
+    Returns:
+        Number of components/packages in the SBOM
+    """
+    try:
+        # Pure SPDX format has packages list at root level
+        if "packages" in sbom_data:
+            return len(sbom_data["packages"])
+        return 0
+    except (KeyError, TypeError):
+        return 0
+
+
 class PURLParser:
     """Parser for Package URLs (PURL)."""
 
@@ -1,11 +1,36 @@
 """Report generation (Builder pattern)."""
 
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List
 
 from ..domain.models import ErrorType, FailureInfo, FetcherStats, PackageDependency
 
+# Status markers shared by the summary counts and the failure section headings
+_MARK_SUCCESS = "✅"
+_MARK_PERMANENT = "🔴"
+_MARK_TRANSIENT = "⚠️"
+_MARK_FAILED = "❌"
+
+
+def group_failures_by_type(failures: List[FailureInfo]) -> Dict[ErrorType, List[FailureInfo]]:
+    """
+    Group failures by error type, keeping their original order within each group.
+
+    Args:
+        failures: Failed downloads
+
+    Returns:
+        Mapping of error type to its failures (types without failures are absent)
+    """
+    by_type = attrgetter("error_type")
+    return {
+        error_type: list(group)
+        for error_type, group in groupby(sorted(failures, key=by_type), key=by_type)
+    }
+
 
 class MarkdownReporter:
     """Generates Markdown execution reports."""
@@ -41,8 +66,52 @@ class MarkdownReporter:
         Returns:
             Filename of generated report
         """
-        md_filename = f"{owner}_{repo}_execution_report.md"
-        md_path = output_dir / md_filename
+        md_filename = self.filename(owner, repo)
+        content = self.render(
+            output_dir,
+            owner,
+            repo,
+            stats,
+            packages,
+            version_mapping,
+            failed_sboms,
+            unmapped_packages,
+            root_component_count,
+            dependency_component_counts,
+        )
+
+        with open(output_dir / md_filename, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        return md_filename
+
+    @staticmethod
+    def filename(owner: str, repo: str) -> str:
+        """Return the report filename for a repository."""
+        return f"{owner}_{repo}_execution_report.md"
+
+    def render(
+        self,
+        output_dir: Path,
+        owner: str,
+        repo: str,
+        stats: FetcherStats,
+        packages: List[PackageDependency],
+        version_mapping: Dict[str, Any],
+        failed_sboms: List[FailureInfo],
+        unmapped_packages: List[PackageDependency],
+        root_component_count: int = 0,
+        dependency_component_counts: Dict[str, int] = None,
+    ) -> str:
+        """
+        Render the Markdown report without writing it.
+
+        Takes the same arguments as generate().
+
+        Returns:
+            Report content
+        """
+        md_filename = self.filename(owner, repo)
 
         # Prepare data
         repos_with_multiple_versions = [
@@ -70,10 +139,16 @@ class MarkdownReporter:
         md_content.append(f"- **Unique repositories:** {stats.unique_repos}")
         md_content.append(f"- **Duplicate versions skipped:** {stats.duplicates_skipped}")
         md_content.append(f"- **Packages without GitHub repos:** {stats.packages_without_github}\n")
-        md_content.append(f"- **SBOMs downloaded successfully:** ✅ **{stats.sboms_downloaded}**")
-        md_content.append(f"- **SBOMs failed (permanent):** 🔴 **{stats.sboms_failed_permanent}**")
-        md_content.append(f"- **SBOMs failed (transient):** ⚠️ **{stats.sboms_failed_transient}**")
-        md_content.append(f"- **SBOMs failed (total):** ❌ **{stats.sboms_failed}**")
+        md_content.append(
+            f"- **SBOMs downloaded successfully:** {_MARK_SUCCESS} **{stats.sboms_downloaded}**"
+        )
+        md_content.append(
+            f"- **SBOMs failed (permanent):** {_MARK_PERMANENT} **{stats.sboms_failed_permanent}**"
+        )
+        md_content.append(
+            f"- **SBOMs failed (transient):** {_MARK_TRANSIENT} **{stats.sboms_failed_transient}**"
+        )
+        md_content.append(f"- **SBOMs failed (total):** {_MARK_FAILED} **{stats.sboms_failed}**")
         md_content.append(f"- **Elapsed time:** {stats.elapsed_time()}\n")
 
         # Important Note
@@ -171,8 +246,9 @@ class MarkdownReporter:
 
         # Failed SBOMs - separate permanent and transient
         if failed_sboms:
-            permanent_failures = [f for f in failed_sboms if f.error_type == ErrorType.PERMANENT]
-            transient_failures = [f for f in failed_sboms if f.error_type == ErrorType.TRANSIENT]
+            failures_by_type = group_failures_by_type(failed_sboms)
+            permanent_failures = failures_by_type.get(ErrorType.PERMANENT, [])
+            transient_failures = failures_by_type.get(ErrorType.TRANSIENT, [])
 
             md_content.append("## Failed SBOM Downloads\n")
             md_content.append(
@@ -182,7 +258,7 @@ class MarkdownReporter:
             )
 
             if permanent_failures:
-                md_content.append("### 🔴 Permanent Failures\n")
+                md_content.append(f"### {_MARK_PERMANENT} Permanent Failures\n")
                 md_content.append(
                     "*These will consistently fail until the underlying issue "
                     "is fixed (e.g., dependency graph not enabled).*\n"
@@ -195,7 +271,7 @@ class MarkdownReporter:
                     md_content.append(f"- **Error:** `{failure.error}`\n")
 
             if transient_failures:
-                md_content.append("### ⚠️ Transient Failures\n")
+                md_content.append(f"### {_MARK_TRANSIENT} Transient Failures\n")
                 md_content.append(
                     "*These may succeed on retry (e.g., timeouts, rate limits, "
                     "network issues).*\n"
@@ -349,8 +425,4 @@ class MarkdownReporter:
         md_content.append("*Generated by GitHub SBOM API Fetcher*  ")
         md_content.append("*For more information, see README.md*")
 
-        # Write to file
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(md_content))
-
-        return md_filename
+        return "\n".join(md_content)
@@ -1,6 +1,5 @@
 """Main SBOM fetching service orchestrator."""
 
-import json
 import logging
 import os
 import time
@@ -13,33 +12,15 @@ import requests
 from ..domain.models import ErrorType, FailureInfo, FetcherResult, FetcherStats, PackageDependency
 from ..infrastructure.config import Config
 from ..infrastructure.filesystem import SBOMRepository
+from ..infrastructure.serialization import write_json
 from .github_client import GitHubClient
 from .mapper_factory import MapperFactory
-from .parsers import SBOMParser
-from .reporters import MarkdownReporter
+from .parsers import SBOMParser, count_sbom_components
+from .reporters import MarkdownReporter, group_failures_by_type
 
 logger = logging.getLogger(__name__)
 
 
-def count_sbom_components(sbom_data: Dict[str, Any]) -> int:
-    """
-    Count the number of components/packages in an SBOM.
-
-    Args:
-        sbom_data: SBOM JSON data
-
-    Returns:
-        Number of components/packages in the SBOM
-    """
-    try:
-        # Pure SPDX format has packages list at root level
-        if "packages" in sbom_data:
-            return len(sbom_data["packages"])
-        return 0
-    except (KeyError, TypeError):
-        return 0
-
-
 class SBOMFetcherService:
     """
     Main service orchestrating SBOM fetching workflow.
@@ -145,21 +126,24 @@ class SBOMFetcherService:
         logger.info("STEP 3: Mapping Packages to GitHub Repositories")
         logger.info("=" * 70)
 
-        unmapped_packages = []
+        # Partition once here so unmapped packages never reach the download step
+        mapped_packages: List[PackageDependency] = []
+        unmapped_packages: List[PackageDependency] = []
         for i, pkg in enumerate(packages, 1):
             if i % 20 == 0:
                 logger.info("Mapping progress: %d/%d", i, len(packages))
 
-            if self._mapper_factory.map_package_to_github(pkg):
-                stats.github_repos_mapped += 1
+            if self._mapper_factory.map_package_to_github(pkg) and pkg.github_repository:
+                mapped_packages.append(pkg)
             else:
-                stats.packages_without_github += 1
                 unmapped_packages.append(pkg)
 
             # Rate limiting for registry APIs
             if i % 10 == 0:
                 time.sleep(0.5)
 
+        stats.github_repos_mapped = len(mapped_packages)
+        stats.packages_without_github = len(unmapped_packages)
         logger.info("Mapped %d packages to GitHub repos", stats.github_repos_mapped)
         logger.info("Packages without GitHub repos: %d", stats.packages_without_github)
 
@@ -173,8 +157,6 @@ class SBOMFetcherService:
         logger.info("STEP 4: Downloading Dependency SBOMs (Deduplicated)")
         logger.info("=" * 70)
 
-        mapped_packages = [p for p in packages if p.github_repository]
-
         # Deduplicate: Track by repository, not version
         repo_to_packages: Dict[str, List[PackageDependency]] = {}
         for pkg in mapped_packages:
@@ -194,14 +176,26 @@ class SBOMFetcherService:
         failed_sboms: List[FailureInfo] = []
         dependency_component_counts: Dict[str, int] = {}  # Track component counts per dependency
 
-        for i, (repo_key, pkgs) in enumerate(repo_to_packages.items(), 1):
-            pkg = pkgs[0]  # Use first package for download
-            versions = [p.version for p in pkgs]
+        # One download per repository, using the first package of each group.
+        # Downloads run concurrently; progress is logged as each one finishes
+        # and results come back in repository order.
+        logger.info("Fetching %d dependency SBOMs...", len(repo_to_packages))
+        repo_groups = list(repo_to_packages.items())
+        download_pkgs = [pkgs[0] for _, pkgs in repo_groups]
+        self._github_client.prefetch_default_branches(
+            session, [pkg.github_repository for pkg in download_pkgs]
+        )
+        finished = 0
 
+        def log_progress(index: int, downloaded: bool) -> None:
+            nonlocal finished
+            finished += 1
+            repo_key, pkgs = repo_groups[index]
+            versions = [p.version for p in pkgs]
             logger.info(
-                "[%d/%d] Fetching SBOM for %s (versions: %s)",
-                i,
-                len(repo_to_packages),
+                "[%d/%d] SBOM for %s (versions: %s)",
+                finished,
+                len(repo_groups),
                 repo_key,
                 (
                     ", ".join(versions)
@@ -210,30 +204,21 @@ class SBOMFetcherService:
                 ),
             )
 
-            if self._github_client.download_dependency_sbom(session, pkg, str(deps_dir)):
+        download_results = self._github_client.download_dependency_sboms(
+            session, download_pkgs, str(deps_dir), on_complete=log_progress
+        )
+
+        for (repo_key, pkgs), downloaded in zip(repo_groups, download_results):
+            pkg = pkgs[0]
+            versions = [p.version for p in pkgs]
+
+            if downloaded:
                 stats.sboms_downloaded += 1
 
-                # Count components in this dependency SBOM
-                component_count = 0
-                try:
-                    branch = self._github_client.get_default_branch(
-                        session, pkg.github_repository.owner, pkg.github_repository.repo
-                    )
-                    # Sanitize branch name - replace slashes with underscores for valid filenames
-                    safe_branch = branch.replace("/", "_")
-                    sbom_file = f"{pkg.github_repository.owner}_{pkg.github_repository.repo}_{safe_branch}.json"
-                    sbom_path = deps_dir / sbom_file
-
-                    if sbom_path.exists():
-                        with open(sbom_path, "r") as f:
-                            dep_sbom_data = json.load(f)
-                            component_count = count_sbom_components(dep_sbom_data)
-                except (json.JSONDecodeError, OSError, TypeError, AttributeError) as e:
-                    logger.debug(f"Could not count components for {repo_key}: {e}")
-                    component_count = 0
-                    sbom_file = (
-                        f"{pkg.github_repository.owner}_{pkg.github_repository.repo}_current.json"
-                    )
+                # The client records the file name and component count while
+                # saving, so the SBOM does not need to be read back from disk.
+                sbom_file = pkg.sbom_file
+                component_count = pkg.sbom_component_count
 
                 dependency_component_counts[repo_key] = component_count
 
@@ -251,9 +236,9 @@ class SBOMFetcherService:
                 error_type = pkg.error_type or ErrorType.UNKNOWN
 
                 # Track by failure type
-                if error_type == ErrorType.PERMANENT:
+                if error_type is ErrorType.PERMANENT:
                     stats.sboms_failed_permanent += 1
-                elif error_type == ErrorType.TRANSIENT:
+                elif error_type is ErrorType.TRANSIENT:
                     stats.sboms_failed_transient += 1
                 else:
                     stats.sboms_failed_permanent += 1  # Default to permanent
@@ -270,18 +255,19 @@ class SBOMFetcherService:
                 )
                 logger.warning("  Failed (%s): %s", error_type.value, error_msg)
 
-            # Count skipped duplicates
+            # Count skipped duplicates and share the download outcome with them
             if len(pkgs) > 1:
                 stats.duplicates_skipped += len(pkgs) - 1
-
-            # Rate limiting
-            if i % 10 == 0:
-                time.sleep(1)
+                for duplicate in pkgs[1:]:
+                    duplicate.sbom_downloaded = pkg.sbom_downloaded
+                    duplicate.sbom_file = pkg.sbom_file
+                    duplicate.sbom_component_count = pkg.sbom_component_count
+                    duplicate.error = pkg.error
+                    duplicate.error_type = pkg.error_type
 
         # Save version mapping
         mapping_file = output_base / "version_mapping.json"
-        with open(mapping_file, "w") as f:
-            json.dump(version_mapping, f, indent=2)
+        write_json(mapping_file, version_mapping)
         logger.info("\nSaved version mapping: version_mapping.json")
 
         # Generate Markdown execution report
@@ -343,8 +329,9 @@ class SBOMFetcherService:
             logger.info("=" * 70)
             logger.info("")
 
-            permanent_failures = [f for f in failed_sboms if f.error_type == ErrorType.PERMANENT]
-            transient_failures = [f for f in failed_sboms if f.error_type == ErrorType.TRANSIENT]
+            failures_by_type = group_failures_by_type(failed_sboms)
+            permanent_failures = failures_by_type.get(ErrorType.PERMANENT, [])
+            transient_failures = failures_by_type.get(ErrorType.TRANSIENT, [])
 
             if permanent_failures:
                 logger.info("🔴 PERMANENT FAILURES (%d):", len(permanent_failures))
@@ -374,7 +361,6 @@ def save_root_sbom(sbom_data: Dict[str, Any], output_dir: str, owner: str, repo:
     filename = f"{owner}_{repo}_root.json"
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, "w") as f:
-        json.dump(sbom_data, f, indent=2)
+    write_json(filepath, sbom_data)
 
     logger.info("Saved root SBOM: %s", filename)
@@ -2,11 +2,28 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import MagicMock, Mock
+from typing import Any, Callable, Dict, List, Optional, Union
+from unittest.mock import Mock
 
 import pytest
 
+from sbom_fetcher.domain.models import (
+    FetcherResult,
+    FetcherStats,
+    GitHubRepository,
+    PackageDependency,
+)
+from sbom_fetcher.infrastructure.config import Config
+
+_UNIT_DIR = Path(__file__).parent / "unit"
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """Mark every test under tests/unit as ``unit``."""
+    for item in items:
+        if _UNIT_DIR in item.path.parents:
+            item.add_marker(pytest.mark.unit)
+
 
 @pytest.fixture
 def sample_sbom_data() -> Dict[str, Any]:
@@ -48,6 +65,84 @@ def sample_sbom_data() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def key_file(tmp_path_factory) -> Callable[[Union[str, Dict[str, Any]]], Path]:
+    """
+    Return a writer for keys.json files shared across the session.
+
+    Each distinct payload (a dict, or raw text for malformed files) is written
+    once; later requests for the same payload get the existing path back.
+    Callers must treat the files as read-only.
+    """
+    directory = tmp_path_factory.mktemp("keys")
+    written: Dict[str, Path] = {}
+
+    def write(payload: Union[str, Dict[str, Any]]) -> Path:
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        if text not in written:
+            path = directory / f"keys_{len(written)}.json"
+            path.write_text(text, encoding="utf-8")
+            written[text] = path
+        return written[text]
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """Default configuration shared across the session; do not mutate."""
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def empty_stats() -> FetcherStats:
+    """Zeroed fetcher statistics shared across the session; do not mutate."""
+    return FetcherStats()
+
+
+@pytest.fixture
+def make_repo() -> Callable[..., GitHubRepository]:
+    """Return a GitHubRepository factory defaulting to lodash/lodash."""
+
+    def make(owner: str = "lodash", repo: str = "lodash") -> GitHubRepository:
+        return GitHubRepository(owner=owner, repo=repo)
+
+    return make
+
+
+@pytest.fixture
+def make_pkg() -> Callable[..., PackageDependency]:
+    """Return a PackageDependency factory defaulting to npm lodash 4.17.21."""
+
+    def make(**overrides: Any) -> PackageDependency:
+        fields: Dict[str, Any] = {
+            "name": "lodash",
+            "version": "4.17.21",
+            "ecosystem": "npm",
+            "purl": "pkg:npm/lodash@4.17.21",
+        }
+        fields.update(overrides)
+        return PackageDependency(**fields)
+
+    return make
+
+
+@pytest.fixture
+def make_result() -> Callable[..., FetcherResult]:
+    """Return a FetcherResult factory defaulting to fresh stats and empty collections."""
+
+    def make(stats: Optional[FetcherStats] = None, **overrides: Any) -> FetcherResult:
+        fields: Dict[str, Any] = {
+            "packages": [],
+            "failed_downloads": [],
+            "version_mapping": {},
+        }
+        fields.update(overrides)
+        return FetcherResult(stats=stats or FetcherStats(), **fields)
+
+    return make
+
+
 @pytest.fixture
 def npm_registry_response_with_repo() -> Dict[str, Any]:
     """Sample npm registry response with GitHub repository."""
@@ -1,258 +1,153 @@
 """Comprehensive unit tests for CLI - Complete Coverage."""
 
 import logging
-import tempfile
+import sys
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from sbom_fetcher.application.cli import parse_arguments, setup_logging
 
+REQUIRED = ["--gh-user", "test-user", "--gh-repo", "test-repo", "--account", "test-account"]
+
 
 class TestParseArguments:
     """Tests for parse_arguments function."""
 
-    def test_parse_arguments_required(self):
-        """Test parsing required arguments."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "test-user",
-                "--gh-repo",
-                "test-repo",
-                "--account",
-                "test-account",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.gh_user == "test-user"
-            assert args.gh_repo == "test-repo"
-            assert args.account == "test-account"
-
-    def test_parse_arguments_with_defaults(self):
-        """Test default values for optional arguments."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "test-user",
-                "--gh-repo",
-                "test-repo",
-                "--account",
-                "test-account",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.key_file == "keys.json"
-            assert args.output_dir == "sboms"
-            assert args.debug is False
-
-    def test_parse_arguments_with_key_file(self):
-        """Test custom key file argument."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "user",
-                "--gh-repo",
-                "repo",
-                "--account",
-                "test-account",
-                "--key-file",
-                "custom_keys.json",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.key_file == "custom_keys.json"
-
-    def test_parse_arguments_with_output_dir(self):
-        """Test custom output directory argument."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "user",
-                "--gh-repo",
-                "repo",
-                "--account",
-                "test-account",
-                "--output-dir",
-                "/custom/output",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.output_dir == "/custom/output"
-
-    def test_parse_arguments_with_debug(self):
-        """Test debug flag."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "user",
-                "--gh-repo",
-                "repo",
-                "--account",
-                "test-account",
-                "--debug",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.debug is True
-
-    def test_parse_arguments_all_options(self):
-        """Test parsing all arguments together."""
-        with patch(
-            "sys.argv",
-            [
-                "prog",
-                "--gh-user",
-                "myuser",
-                "--gh-repo",
-                "myrepo",
-                "--account",
-                "myaccount",
-                "--key-file",
-                "mykeys.json",
-                "--output-dir",
-                "/my/output",
-                "--debug",
-            ],
-        ):
-            args = parse_arguments()
-
-            assert args.gh_user == "myuser"
-            assert args.gh_repo == "myrepo"
-            assert args.account == "myaccount"
-            assert args.key_file == "mykeys.json"
-            assert args.output_dir == "/my/output"
-            assert args.debug is True
-
-    def test_parse_arguments_missing_required(self):
-        """Test error when required arguments missing."""
-        with patch("sys.argv", ["prog"]):
-            with pytest.raises(SystemExit):
-                parse_arguments()
-
-    def test_parse_arguments_missing_gh_user(self):
-        """Test error when gh-user missing."""
-        with patch("sys.argv", ["prog", "--gh-repo", "repo", "--account", "test-account"]):
-            with pytest.raises(SystemExit):
-                parse_arguments()
-
-    def test_parse_arguments_missing_gh_repo(self):
-        """Test error when gh-repo missing."""
-        with patch("sys.argv", ["prog", "--gh-user", "user", "--account", "test-account"]):
-            with pytest.raises(SystemExit):
-                parse_arguments()
-
-    def test_parse_arguments_missing_account(self):
-        """Test error when account missing."""
-        with patch("sys.argv", ["prog", "--gh-user", "user", "--gh-repo", "repo"]):
-            with pytest.raises(SystemExit):
-                parse_arguments()
+    @pytest.mark.parametrize(
+        "extra,expected",
+        [
+            pytest.param(
+                [],
+                {"gh_user": "test-user", "gh_repo": "test-repo", "account": "test-account"},
+                id="required",
+            ),
+            pytest.param(
+                [],
+                {"key_file": "keys.json", "output_dir": "sboms", "debug": False},
+                id="defaults",
+            ),
+            pytest.param(
+                ["--key-file", "custom_keys.json"], {"key_file": "custom_keys.json"}, id="key-file"
+            ),
+            pytest.param(
+                ["--output-dir", "/custom/output"],
+                {"output_dir": "/custom/output"},
+                id="output-dir",
+            ),
+            pytest.param(["--debug"], {"debug": True}, id="debug"),
+            pytest.param(
+                ["--key-file", "mykeys.json", "--output-dir", "/my/output", "--debug"],
+                {
+                    "gh_user": "test-user",
+                    "key_file": "mykeys.json",
+                    "output_dir": "/my/output",
+                    "debug": True,
+                },
+                id="all-options",
+            ),
+        ],
+    )
+    def test_parse_arguments(self, extra, expected):
+        """Test parsed values for required, default and optional arguments."""
+        args = parse_arguments([*REQUIRED, *extra])
+
+        assert {name: getattr(args, name) for name in expected} == expected
+
+    def test_parse_arguments_reads_sys_argv(self, monkeypatch):
+        """Test sys.argv is parsed when no argv is given."""
+        monkeypatch.setattr(sys, "argv", ["prog", *REQUIRED])
+
+        args = parse_arguments()
+
+        assert args.gh_user == "test-user"
+
+    @pytest.mark.parametrize(
+        "argv,missing",
+        [
+            pytest.param([], "--gh-user, --gh-repo, --account", id="nothing"),
+            pytest.param(REQUIRED[2:], "--gh-user", id="gh-user"),
+            pytest.param(REQUIRED[:2] + REQUIRED[4:], "--gh-repo", id="gh-repo"),
+            pytest.param(REQUIRED[:4], "--account", id="account"),
+        ],
+    )
+    def test_parse_arguments_missing_required(self, capsys, argv, missing):
+        """Test a missing required argument exits with a usage error naming it."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_arguments(argv)
+
+        assert exc_info.value.code == 2
+        assert f"the following arguments are required: {missing}" in capsys.readouterr().err
 
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
-    def test_setup_logging_default(self):
+    @pytest.fixture(autouse=True)
+    def file_handler(self, monkeypatch):
+        """Stub the log file handler so tests open no log files."""
+        handler = Mock(return_value=logging.NullHandler())
+        monkeypatch.setattr("sbom_fetcher.application.cli.logging.FileHandler", handler)
+        return handler
+
+    @pytest.fixture(autouse=True)
+    def root_logger(self):
+        """Restore the root logger's handlers and level after each test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield root
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_setup_logging_default(self, tmp_path, file_handler):
         """Test setup logging with default settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_log_dir = Path(tmpdir) / "docs" / "logs"
-                mock_log_dir.mkdir(parents=True, exist_ok=True)
-                mock_path.return_value = mock_log_dir
+        setup_logging(debug=False, log_dir=tmp_path / "logs")
 
-                # Just verify it doesn't crash
-                setup_logging(debug=False)
-                # Function executed successfully
+        file_handler.assert_called_once()
 
-    def test_setup_logging_debug(self):
-        """Test setup logging with debug enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_log_dir = Path(tmpdir) / "docs" / "logs"
-                mock_log_dir.mkdir(parents=True, exist_ok=True)
-                mock_path.return_value = mock_log_dir
+    def test_setup_logging_default_log_dir(self, tmp_path, monkeypatch, file_handler):
+        """Test the log file goes under docs/logs when no directory is given."""
+        monkeypatch.chdir(tmp_path)
 
-                # Just verify it doesn't crash
-                setup_logging(debug=True)
-                # Function executed successfully
+        setup_logging(debug=False)
 
-    def test_setup_logging_creates_log_dir(self):
-        """Test that setup_logging creates log directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir) / "docs" / "logs"
+        assert (tmp_path / "docs" / "logs").is_dir()
+        assert file_handler.call_args.args[0].parent == Path("docs/logs")
 
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_path.return_value = log_dir
+    def test_setup_logging_debug(self, tmp_path):
+        """Test setup logging with debug enabled."""
+        # Just verify it doesn't crash
+        setup_logging(debug=True, log_dir=tmp_path / "logs")
 
-                # Manually create the directory since we're mocking Path
-                log_dir.mkdir(parents=True, exist_ok=True)
+    def test_setup_logging_creates_log_dir(self, tmp_path):
+        """Test that setup_logging creates log directory."""
+        log_dir = tmp_path / "docs" / "logs"
 
-                setup_logging(debug=False)
+        setup_logging(debug=False, log_dir=log_dir)
 
-                assert log_dir.exists()
+        assert log_dir.is_dir()
 
-    def test_setup_logging_creates_log_file(self):
+    def test_setup_logging_creates_log_file(self, tmp_path, file_handler):
         """Test that setup_logging creates log file with timestamp."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir) / "docs" / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_path.return_value = log_dir
+        log_dir = tmp_path / "logs"
 
-                # Mock datetime to control timestamp
-                mock_time = datetime(2024, 1, 1, 12, 30, 45)
-                with patch("sbom_fetcher.application.cli.datetime") as mock_datetime:
-                    mock_datetime.now.return_value = mock_time
-                    mock_datetime.strftime = datetime.strftime
+        # Mock datetime to control timestamp
+        mock_time = datetime(2024, 1, 1, 12, 30, 45)
+        with patch("sbom_fetcher.application.cli.datetime") as mock_datetime:
+            mock_datetime.now.return_value = mock_time
 
-                    setup_logging(debug=False)
+            setup_logging(debug=False, log_dir=log_dir)
 
-                    # Check that a log file was attempted to be created
-                    # (We can't easily verify the actual file since it's in a real path)
-                    mock_datetime.now.assert_called()
+        file_handler.assert_called_once_with(
+            log_dir / "run_2024-01-01_12.30.45.log", encoding="utf-8"
+        )
 
-    def test_setup_logging_handlers(self):
+    def test_setup_logging_handlers(self, tmp_path):
         """Test that both console and file handlers are configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir) / "docs" / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_path.return_value = log_dir
-
-                setup_logging(debug=False)
-
-                root_logger = logging.getLogger()
-                # Should have at least 2 handlers (console + file)
-                assert len(root_logger.handlers) >= 2
-
-    def test_setup_logging_format(self):
-        """Test that logging format is set correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir) / "docs" / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            with patch("sbom_fetcher.application.cli.Path") as mock_path:
-                mock_path.return_value = log_dir
+        setup_logging(debug=False, log_dir=tmp_path / "logs")
 
-                # Just verify it doesn't crash
-                setup_logging(debug=False)
-                # Function executed successfully
+        root_logger = logging.getLogger()
+        # Should have at least 2 handlers (console + file)
+        assert len(root_logger.handlers) >= 2
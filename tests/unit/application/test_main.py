@@ -1,50 +1,50 @@
 """Comprehensive unit tests for main application - Complete Coverage."""
 
 import json
-import tempfile
+import os
+from argparse import Namespace
+from collections import Counter
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 import requests
+import responses
 
+from sbom_fetcher.application import cli
+from sbom_fetcher.application import main as main_module
 from sbom_fetcher.application.main import (
     build_session,
     create_service,
     load_token,
     main,
 )
-from sbom_fetcher.domain.exceptions import TokenLoadError
+from sbom_fetcher.domain.exceptions import InvalidConfigError, TokenLoadError
 from sbom_fetcher.infrastructure.config import Config
 
+# The pipeline fixture fakes Config.load; keep the real one for validation tests
+_REAL_CONFIG_LOAD = vars(Config)["load"]
+
 
 class TestLoadToken:
     """Tests for load_token function."""
 
-    def test_load_token_github_token_key(self, tmp_path):
+    def test_load_token_github_token_key(self, key_file):
         """Test loading token with 'github_token' key."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text(json.dumps({"github_token": "test_token_123"}))
-
-        token = load_token(key_file)
+        token = load_token(key_file({"github_token": "test_token_123"}))
 
         assert token == "test_token_123"
 
-    def test_load_token_token_key(self, tmp_path):
+    def test_load_token_token_key(self, key_file):
         """Test loading token with 'token' key."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text(json.dumps({"token": "test_token_456"}))
-
-        token = load_token(key_file)
+        token = load_token(key_file({"token": "test_token_456"}))
 
         assert token == "test_token_456"
 
-    def test_load_token_accounts_format(self, tmp_path):
+    def test_load_token_accounts_format(self, key_file):
         """Test loading token from accounts array."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text(json.dumps({"accounts": [{"token": "test_token_789"}]}))
-
-        token = load_token(key_file)
+        token = load_token(key_file({"accounts": [{"token": "test_token_789"}]}))
 
         assert token == "test_token_789"
 
@@ -55,252 +55,325 @@ class TestLoadToken:
         with pytest.raises(TokenLoadError, match="not found"):
             load_token(key_file)
 
-    def test_load_token_invalid_json(self, tmp_path):
+    def test_load_token_invalid_json(self, key_file):
         """Test error with invalid JSON."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text("{ invalid json }")
-
         with pytest.raises(TokenLoadError, match="Invalid JSON"):
-            load_token(key_file)
+            load_token(key_file("{ invalid json }"))
 
-    def test_load_token_no_token_found(self, tmp_path):
+    def test_load_token_no_token_found(self, key_file):
         """Test error when no token key found."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text(json.dumps({"other_key": "value"}))
-
         with pytest.raises(TokenLoadError, match="No GitHub token found"):
-            load_token(key_file)
+            load_token(key_file({"other_key": "value"}))
 
-    def test_load_token_empty_accounts(self, tmp_path):
+    def test_load_token_empty_accounts(self, key_file):
         """Test with empty accounts array."""
-        key_file = tmp_path / "keys.json"
-        key_file.write_text(json.dumps({"accounts": []}))
-
         with pytest.raises(TokenLoadError, match="No GitHub token found"):
-            load_token(key_file)
+            load_token(key_file({"accounts": []}))
 
-    def test_load_token_priority_github_token(self, tmp_path):
+    def test_load_token_priority_github_token(self, key_file):
         """Test github_token takes priority over token."""
+        token = load_token(key_file({"github_token": "priority_token", "token": "secondary_token"}))
+
+        assert token == "priority_token"
+
+    def test_load_token_reuses_parsed_keys_file(self, tmp_path):
+        """Test looking up several accounts parses the keys file once."""
         key_file = tmp_path / "keys.json"
         key_file.write_text(
-            json.dumps({"github_token": "priority_token", "token": "secondary_token"})
+            json.dumps(
+                {"accounts": [{"username": "a", "token": "ta"}, {"username": "b", "token": "tb"}]}
+            )
         )
 
-        token = load_token(key_file)
+        with patch("sbom_fetcher.application.main.json.load", wraps=json.load) as mock_load:
+            assert load_token(key_file, "a") == "ta"
+            assert load_token(key_file, "b") == "tb"
 
-        assert token == "priority_token"
+        assert mock_load.call_count == 1
+
+    def test_load_token_rereads_modified_keys_file(self, tmp_path):
+        """Test an edited keys file is parsed again."""
+        key_file = tmp_path / "keys.json"
+        key_file.write_text(json.dumps({"token": "old_token"}))
+        assert load_token(key_file) == "old_token"
+
+        key_file.write_text(json.dumps({"token": "new_token"}))
+        mtime_ns = key_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(key_file, ns=(mtime_ns, mtime_ns))
+
+        assert load_token(key_file) == "new_token"
+
+    @pytest.mark.parametrize("atomic", [False, True], ids=["in-place", "replaced"])
+    def test_load_token_rereads_keys_file_with_same_mtime(self, tmp_path, atomic):
+        """Test a rewrite within one timestamp tick is still picked up."""
+        key_file = tmp_path / "keys.json"
+        key_file.write_text(json.dumps({"token": "old_token"}))
+        mtime_ns = key_file.stat().st_mtime_ns
+        assert load_token(key_file) == "old_token"
+
+        if atomic:
+            # Same size, new inode: an editor saving via rename
+            new_file = tmp_path / "keys.json.new"
+            new_file.write_text(json.dumps({"token": "new_token"}))
+            os.utime(new_file, ns=(mtime_ns, mtime_ns))
+            os.replace(new_file, key_file)
+        else:
+            key_file.write_text(json.dumps({"token": "newer_token"}))
+            os.utime(key_file, ns=(mtime_ns, mtime_ns))
+
+        assert load_token(key_file) == ("new_token" if atomic else "newer_token")
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Session shared by the header checks, which only read it."""
+    return build_session("test_token_123")
 
 
 class TestBuildSession:
     """Tests for build_session function."""
 
-    def test_build_session_creates_session(self):
+    def test_build_session_creates_session(self, session):
         """Test building session with token."""
-        token = "test_token_123"
+        assert isinstance(session, requests.Session)
 
-        session = build_session(token)
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("Authorization", "token test_token_123"),
+            ("Accept", "application/vnd.github+json"),
+            ("X-GitHub-Api-Version", "2022-11-28"),
+            ("User-Agent", "github-sbom-api-fetcher/1.0"),
+        ],
+    )
+    def test_build_session_headers(self, session, header, expected):
+        """Test each required GitHub header is set."""
+        assert session.headers[header] == expected
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "statuses,expected_status,expected_calls",
+        [
+            pytest.param([500, 200], 200, 2, id="5xx-retried"),
+            pytest.param([429, 429, 429], 429, 3, id="429-exhausted"),
+            pytest.param([404], 404, 1, id="4xx-not-retried"),
+            pytest.param([403, 200], 200, 2, id="403-retry-after-retried"),
+        ],
+    )
+    def test_build_session_retries_transient_statuses(
+        self, statuses, expected_status, expected_calls
+    ):
+        """Test the session adapter retries 429/5xx and returns the final response."""
+        url = "https://api.github.com/repos/test/repo/dependency-graph/sbom"
+        for status in statuses:
+            responses.add(responses.GET, url, status=status, headers={"Retry-After": "0"})
 
-        assert isinstance(session, requests.Session)
-        assert session.headers["Authorization"] == "token test_token_123"
-        assert session.headers["Accept"] == "application/vnd.github+json"
-        assert session.headers["X-GitHub-Api-Version"] == "2022-11-28"
-        assert "github-sbom-api-fetcher" in session.headers["User-Agent"]
+        session = build_session("test_token", max_retries=2)
+
+        assert session.get(url).status_code == expected_status
+        assert len(responses.calls) == expected_calls
+
+    @responses.activate
+    def test_build_session_does_not_retry_plain_403(self):
+        """Test a 403 without Retry-After is a permissions error and is not retried."""
+        url = "https://api.github.com/repos/test/repo/dependency-graph/sbom"
+        responses.add(responses.GET, url, status=403)
+
+        session = build_session("test_token", max_retries=2)
+
+        assert session.get(url).status_code == 403
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_build_session_with_cache_reuses_responses(self, tmp_path):
+        """Test a cached session answers repeat requests without hitting the network."""
+        pytest.importorskip("requests_cache")
+        url = "https://api.github.com/repos/test/repo/dependency-graph/sbom"
+        responses.add(responses.GET, url, json={"sbom": {}}, headers={"ETag": '"abc"'})
+
+        session = build_session("test_token", tmp_path / "cache")
 
-    def test_build_session_headers(self):
-        """Test all required headers are set."""
-        token = "my_token"
+        assert session.get(url).json() == {"sbom": {}}
+        assert session.get(url).from_cache is True
+        assert len(responses.calls) == 1
+        assert session.headers["Authorization"] == "token test_token"
 
-        session = build_session(token)
+    @responses.activate
+    def test_build_session_cache_is_keyed_by_token(self, tmp_path):
+        """Test a response cached under one token is not served to another."""
+        pytest.importorskip("requests_cache")
+        url = "https://api.github.com/repos/test/repo/dependency-graph/sbom"
+        responses.add(responses.GET, url, json={"sbom": {}}, headers={"ETag": '"abc"'})
 
-        required_headers = {
-            "Authorization",
-            "Accept",
-            "X-GitHub-Api-Version",
-            "User-Agent",
-        }
-        assert required_headers.issubset(session.headers.keys())
+        build_session("token_a", tmp_path / "cache").get(url)
+        resp = build_session("token_b", tmp_path / "cache").get(url)
+
+        assert resp.from_cache is False
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["Authorization"] == "token token_b"
+
+    def test_build_session_pool_sized_for_workers(self):
+        """Test the adapter pool holds one keep-alive connection per worker."""
+        session = build_session("test_token", pool_size=16)
+
+        adapter = session.get_adapter("https://api.github.com")
+        assert adapter._pool_maxsize == 16
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+
+    def test_build_session_cache_without_requests_cache(self, tmp_path):
+        """Test a plain session is built when requests-cache is not installed."""
+        with patch("sbom_fetcher.application.main.requests_cache", None):
+            session = build_session("test_token", tmp_path / "cache")
+
+        assert type(session) is requests.Session
+        assert not (tmp_path / "cache").exists()
 
 
 class TestCreateService:
     """Tests for create_service function."""
 
-    def test_create_service(self):
+    def test_create_service(self, tmp_path):
         """Test creating service with dependencies."""
         config = Config()
         token = "test_token"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config.output_dir = Path(tmpdir)
-            service = create_service(config, token)
+        config.output_dir = tmp_path
+        service = create_service(config, token)
 
-            assert service is not None
-            assert service._config == config
-            assert service._github_client is not None
-            assert service._mapper_factory is not None
-            assert service._repository is not None
-            assert service._reporter is not None
+        assert service is not None
+        assert service._config == config
+        assert service._github_client is not None
+        assert service._mapper_factory is not None
+        assert service._repository is not None
+        assert service._reporter is not None
 
-    def test_create_service_components(self):
+    def test_create_service_components(self, tmp_path):
         """Test all service components are created."""
         config = Config()
         token = "test_token"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config.output_dir = Path(tmpdir)
-            service = create_service(config, token)
+        config.output_dir = tmp_path
+        service = create_service(config, token)
 
-            # Verify all components exist
-            assert hasattr(service, "_github_client")
-            assert hasattr(service, "_mapper_factory")
-            assert hasattr(service, "_repository")
-            assert hasattr(service, "_reporter")
-            assert hasattr(service, "_parser")
+        # Verify all components exist
+        assert hasattr(service, "_github_client")
+        assert hasattr(service, "_mapper_factory")
+        assert hasattr(service, "_repository")
+        assert hasattr(service, "_reporter")
+        assert hasattr(service, "_parser")
 
 
 class TestMain:
     """Tests for main function."""
 
-    @patch("sbom_fetcher.application.main.create_service")
-    @patch("sbom_fetcher.application.main.build_session")
-    @patch("sbom_fetcher.application.main.load_token")
-    @patch("sbom_fetcher.application.main.Config")
-    @patch("sbom_fetcher.application.cli.parse_arguments")
-    @patch("sbom_fetcher.application.cli.setup_logging")
-    def test_main_success(
-        self,
-        mock_setup_logging,
-        mock_parse_args,
-        mock_config_class,
-        mock_load_token,
-        mock_build_session,
-        mock_create_service,
-    ):
-        """Test successful main execution."""
-        # Setup mocks
-        mock_args = Mock()
-        mock_args.debug = False
-        mock_args.output_dir = None
-        mock_args.key_file = None
-        mock_args.gh_user = "test-user"
-        mock_args.gh_repo = "test-repo"
-        mock_parse_args.return_value = mock_args
-
-        mock_config = Mock()
-        mock_config.key_file = Path("keys.json")
-        mock_config_class.load.return_value = mock_config
-
-        mock_load_token.return_value = "test_token"
-        mock_session = Mock()
-        mock_build_session.return_value = mock_session
-
-        mock_service = Mock()
-        mock_result = Mock()
-        mock_service.fetch_all_sboms.return_value = mock_result
-        mock_create_service.return_value = mock_service
-
-        # Execute
-        exit_code = main()
-
-        # Verify
-        assert exit_code == 0
-        mock_setup_logging.assert_called_once_with(False)
-        mock_load_token.assert_called_once()
-        mock_build_session.assert_called_once_with("test_token")
-        mock_service.fetch_all_sboms.assert_called_once_with("test-user", "test-repo", mock_session)
-
-    @patch("sbom_fetcher.application.main.load_token")
-    @patch("sbom_fetcher.application.main.Config")
-    @patch("sbom_fetcher.application.cli.parse_arguments")
-    @patch("sbom_fetcher.application.cli.setup_logging")
-    def test_main_token_load_error(
-        self, mock_setup_logging, mock_parse_args, mock_config_class, mock_load_token
-    ):
-        """Test main handles TokenLoadError."""
-        mock_args = Mock()
-        mock_args.debug = False
-        mock_args.output_dir = None
-        mock_args.key_file = None
-        mock_parse_args.return_value = mock_args
+    @pytest.fixture
+    def cli_args(self, tmp_path):
+        """Parsed command-line arguments for a default run."""
+        return Namespace(
+            debug=False,
+            output_dir=str(tmp_path),
+            key_file=None,
+            account=None,
+            gh_user="test-user",
+            gh_repo="test-repo",
+        )
 
-        mock_config = Mock()
-        mock_config.key_file = Path("keys.json")
-        mock_config_class.load.return_value = mock_config
+    @pytest.fixture
+    def pipeline(self, monkeypatch, cli_args):
+        """
+        Replace main()'s collaborators with plain fakes.
+
+        Returns a namespace holding the CLI args, config and session the fakes
+        hand out, a Counter of calls, and the recorded arguments. Tests tweak
+        ``pipeline.args`` or set ``pipeline.raises`` to make a step fail.
+        """
+        state = SimpleNamespace(
+            args=cli_args,
+            config=Config(),
+            session=object(),
+            raises={},
+            calls=Counter(),
+            recorded={},
+        )
 
-        mock_load_token.side_effect = TokenLoadError("Token not found")
+        def fake(name, result):
+            def call(*args, **kwargs):
+                state.calls[name] += 1
+                state.recorded[name] = (args, kwargs)
+                if name in state.raises:
+                    raise state.raises[name]
+                return result() if callable(result) else result
+
+            return call
+
+        service = SimpleNamespace(fetch_all_sboms=fake("fetch_all_sboms", None))
+        monkeypatch.setattr(cli, "parse_arguments", fake("parse_arguments", lambda: state.args))
+        monkeypatch.setattr(cli, "setup_logging", fake("setup_logging", None))
+        monkeypatch.setattr(Config, "load", fake("load_config", lambda: state.config))
+        monkeypatch.setattr(main_module, "load_token", fake("load_token", "test_token"))
+        monkeypatch.setattr(
+            main_module, "build_session", fake("build_session", lambda: state.session)
+        )
+        monkeypatch.setattr(main_module, "create_service", fake("create_service", service))
+        return state
 
+    def test_main_success(self, pipeline, tmp_path):
+        """Test successful main execution."""
         exit_code = main()
 
-        assert exit_code == 1
-
-    @patch("sbom_fetcher.application.main.Config")
-    @patch("sbom_fetcher.application.cli.parse_arguments")
-    @patch("sbom_fetcher.application.cli.setup_logging")
-    def test_main_keyboard_interrupt(self, mock_setup_logging, mock_parse_args, mock_config_class):
-        """Test main handles KeyboardInterrupt."""
-        mock_args = Mock()
-        mock_args.debug = False
-        mock_parse_args.return_value = mock_args
-
-        mock_config_class.load.side_effect = KeyboardInterrupt()
+        assert exit_code == 0
+        assert pipeline.config.output_dir == tmp_path
+        assert pipeline.recorded["setup_logging"] == ((False,), {})
+        assert pipeline.recorded["load_token"] == ((pipeline.config.key_file, None), {})
+        assert pipeline.recorded["build_session"] == (
+            ("test_token", pipeline.config.http_cache_dir, pipeline.config.max_retries),
+            {"pool_size": pipeline.config.max_workers},
+        )
+        assert pipeline.recorded["fetch_all_sboms"] == (
+            ("test-user", "test-repo", pipeline.session),
+            {},
+        )
+        assert pipeline.calls["fetch_all_sboms"] == 1
+
+    @pytest.mark.parametrize(
+        "step,error,expected_code,reached",
+        [
+            ("load_token", TokenLoadError("Token not found"), 1, "load_token"),
+            ("load_config", KeyboardInterrupt(), 130, "load_config"),
+            ("load_config", Exception("General error"), 1, "load_config"),
+            ("fetch_all_sboms", Exception("API down"), 1, "fetch_all_sboms"),
+        ],
+    )
+    def test_main_error_exit_codes(self, pipeline, step, error, expected_code, reached):
+        """Test main maps failures in each step to its exit code."""
+        pipeline.raises[step] = error
 
         exit_code = main()
 
-        assert exit_code == 130
-
-    @patch("sbom_fetcher.application.main.Config")
-    @patch("sbom_fetcher.application.cli.parse_arguments")
-    @patch("sbom_fetcher.application.cli.setup_logging")
-    def test_main_general_exception(self, mock_setup_logging, mock_parse_args, mock_config_class):
-        """Test main handles general exceptions."""
-        mock_args = Mock()
-        mock_args.debug = False
-        mock_parse_args.return_value = mock_args
+        assert exit_code == expected_code
+        assert pipeline.calls[reached] == 1
+        assert pipeline.calls["fetch_all_sboms"] == (step == "fetch_all_sboms")
 
-        mock_config_class.load.side_effect = Exception("General error")
+    def test_main_rejects_zero_max_workers(self, pipeline, monkeypatch):
+        """Test an invalid worker count from the environment stops main before any I/O."""
+        monkeypatch.setattr(Config, "load", _REAL_CONFIG_LOAD)
+        monkeypatch.setenv("SBOM_FETCHER_MAX_WORKERS", "0")
 
         exit_code = main()
 
         assert exit_code == 1
+        assert pipeline.calls["load_token"] == 0
+        assert pipeline.calls["build_session"] == 0
 
-    @patch("sbom_fetcher.application.main.create_service")
-    @patch("sbom_fetcher.application.main.build_session")
-    @patch("sbom_fetcher.application.main.load_token")
-    @patch("sbom_fetcher.application.main.Config")
-    @patch("sbom_fetcher.application.cli.parse_arguments")
-    @patch("sbom_fetcher.application.cli.setup_logging")
-    def test_main_with_custom_paths(
-        self,
-        mock_setup_logging,
-        mock_parse_args,
-        mock_config_class,
-        mock_load_token,
-        mock_build_session,
-        mock_create_service,
-    ):
+    def test_main_with_custom_paths(self, pipeline):
         """Test main with custom output and key file paths."""
-        mock_args = Mock()
-        mock_args.debug = True
-        mock_args.output_dir = "/custom/output"
-        mock_args.key_file = "/custom/keys.json"
-        mock_args.gh_user = "user"
-        mock_args.gh_repo = "repo"
-        mock_parse_args.return_value = mock_args
-
-        mock_config = Mock()
-        mock_config.key_file = Path("keys.json")
-        mock_config_class.load.return_value = mock_config
-
-        mock_load_token.return_value = "token"
-        mock_session = Mock()
-        mock_build_session.return_value = mock_session
-
-        mock_service = Mock()
-        mock_service.fetch_all_sboms.return_value = Mock()
-        mock_create_service.return_value = mock_service
+        pipeline.args.debug = True
+        pipeline.args.output_dir = "/custom/output"
+        pipeline.args.key_file = "/custom/keys.json"
 
         exit_code = main()
 
         assert exit_code == 0
-        assert mock_config.output_dir == Path("/custom/output")
-        assert mock_config.key_file == Path("/custom/keys.json")
-        mock_setup_logging.assert_called_once_with(True)
+        assert pipeline.config.output_dir == Path("/custom/output")
+        assert pipeline.config.key_file == Path("/custom/keys.json")
+        assert pipeline.recorded["setup_logging"] == ((True,), {})
@@ -1,5 +1,10 @@
 """Unit tests for domain models."""
 
+import sys
+import time
+
+import pytest
+
 from sbom_fetcher.domain.models import (
     ErrorType,
     FailureInfo,
@@ -13,11 +18,9 @@ from sbom_fetcher.domain.models import (
 class TestPackageDependency:
     """Tests for PackageDependency model."""
 
-    def test_create_package_dependency(self):
+    def test_create_package_dependency(self, make_pkg):
         """Test creating a package dependency."""
-        pkg = PackageDependency(
-            name="lodash", version="4.17.21", ecosystem="npm", purl="pkg:npm/lodash@4.17.21"
-        )
+        pkg = make_pkg()
 
         assert pkg.name == "lodash"
         assert pkg.version == "4.17.21"
@@ -28,78 +31,91 @@ class TestPackageDependency:
         assert pkg.error_type is None
         assert pkg.sbom_downloaded is False
 
-    def test_package_dependency_with_github_repo(self):
+    def test_package_dependency_with_github_repo(self, make_repo, make_pkg):
         """Test package dependency with GitHub repository."""
-        repo = GitHubRepository(owner="lodash", repo="lodash")
-        pkg = PackageDependency(
-            name="lodash",
-            version="4.17.21",
-            ecosystem="npm",
-            purl="pkg:npm/lodash@4.17.21",
-            github_repository=repo,
-        )
+        repo = make_repo()
+        pkg = make_pkg(github_repository=repo)
 
         assert pkg.github_repository == repo
 
-    def test_package_dependency_with_error(self):
+    def test_package_dependency_with_error(self, make_pkg):
         """Test package dependency with error."""
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            error="Dependency graph not enabled",
-            error_type=ErrorType.PERMANENT,
-        )
+        pkg = make_pkg(error="Dependency graph not enabled", error_type=ErrorType.PERMANENT)
 
         assert pkg.error == "Dependency graph not enabled"
         assert pkg.error_type == ErrorType.PERMANENT
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_package_dependency_is_slotted(self, make_pkg):
+        """Test package dependencies carry no per-instance __dict__."""
+        pkg = make_pkg()
+
+        assert not hasattr(pkg, "__dict__")
+        with pytest.raises(AttributeError):
+            pkg.unknown_field = True
+
+    @pytest.mark.parametrize(
+        "field,match",
+        [
+            ("name", "Package name cannot be empty"),
+            ("purl", "PURL cannot be empty"),
+            ("ecosystem", "Ecosystem cannot be empty"),
+        ],
+    )
+    def test_package_dependency_validation(self, make_pkg, field, match):
+        """Test PackageDependency validation rejects each empty required field."""
+        with pytest.raises(ValueError, match=match):
+            make_pkg(**{field: ""})
+
 
 class TestGitHubRepository:
     """Tests for GitHubRepository model."""
 
-    def test_create_github_repository(self):
+    def test_create_github_repository(self, make_repo):
         """Test creating a GitHub repository."""
-        repo = GitHubRepository(owner="lodash", repo="lodash")
+        repo = make_repo()
 
         assert repo.owner == "lodash"
         assert repo.repo == "lodash"
         assert str(repo) == "lodash/lodash"
 
-    def test_github_repository_equality(self):
+    def test_github_repository_equality(self, make_repo):
         """Test GitHub repository equality."""
-        repo1 = GitHubRepository(owner="lodash", repo="lodash")
-        repo2 = GitHubRepository(owner="lodash", repo="lodash")
-        repo3 = GitHubRepository(owner="different", repo="lodash")
+        repo1 = make_repo()
+        repo2 = make_repo()
+        repo3 = make_repo(owner="different")
 
         assert repo1 == repo2
         assert repo1 != repo3
 
-    def test_github_repository_hash(self):
+    def test_github_repository_hash(self, make_repo):
         """Test GitHub repository hashing (for use in sets/dicts)."""
-        repo1 = GitHubRepository(owner="lodash", repo="lodash")
-        repo2 = GitHubRepository(owner="lodash", repo="lodash")
+        repo1 = make_repo()
+        repo2 = make_repo()
 
         # Should be able to use in sets
         repo_set = {repo1, repo2}
         assert len(repo_set) == 1
 
+    @pytest.mark.parametrize("kwargs", [{"owner": ""}, {"repo": ""}])
+    def test_github_repository_validation(self, make_repo, kwargs):
+        """Test GitHubRepository validation rejects an empty owner or repo."""
+        with pytest.raises(ValueError, match="Owner and repo must be non-empty"):
+            make_repo(**kwargs)
+
 
 class TestFetcherStats:
     """Tests for FetcherStats model."""
 
-    def test_create_fetcher_stats(self):
+    def test_create_fetcher_stats(self, empty_stats):
         """Test creating fetcher stats."""
-        stats = FetcherStats()
-
-        assert stats.packages_in_sbom == 0
-        assert stats.github_repos_mapped == 0
-        assert stats.unique_repos == 0
-        assert stats.sboms_downloaded == 0
-        assert stats.sboms_failed == 0
-        assert stats.sboms_failed_permanent == 0
-        assert stats.sboms_failed_transient == 0
+        assert empty_stats.packages_in_sbom == 0
+        assert empty_stats.github_repos_mapped == 0
+        assert empty_stats.unique_repos == 0
+        assert empty_stats.sboms_downloaded == 0
+        assert empty_stats.sboms_failed == 0
+        assert empty_stats.sboms_failed_permanent == 0
+        assert empty_stats.sboms_failed_transient == 0
 
     def test_fetcher_stats_all_fields(self):
         """Test fetcher stats with all fields."""
@@ -124,6 +140,18 @@ class TestFetcherStats:
         assert stats.sboms_failed_permanent == 1
         assert stats.sboms_failed_transient == 1
 
+    @pytest.mark.parametrize("offset,expected", [(5, "5s"), (125, "2m 5s")])
+    def test_fetcher_stats_elapsed_time(self, offset, expected):
+        """Test elapsed time is measured on the monotonic clock and formatted."""
+        stats = FetcherStats(start_time=time.monotonic() - offset)
+
+        assert stats.elapsed_time() == expected
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_fetcher_stats_is_slotted(self, empty_stats):
+        """Test fetcher stats carry no per-instance __dict__."""
+        assert not hasattr(empty_stats, "__dict__")
+
 
 class TestErrorType:
     """Tests for ErrorType enum."""
@@ -144,9 +172,9 @@ class TestErrorType:
 class TestFailureInfo:
     """Tests for FailureInfo model."""
 
-    def test_create_failure_info(self):
+    def test_create_failure_info(self, make_repo):
         """Test creating failure info."""
-        repo = GitHubRepository(owner="test", repo="repo")
+        repo = make_repo(owner="test", repo="repo")
         failure = FailureInfo(
             repository=repo,
             package_name="test-pkg",
@@ -163,9 +191,9 @@ class TestFailureInfo:
         assert failure.error == "Dependency graph not enabled"
         assert failure.error_type == ErrorType.PERMANENT
 
-    def test_failure_info_to_dict(self):
+    def test_failure_info_to_dict(self, make_repo):
         """Test converting failure info to dict."""
-        repo = GitHubRepository(owner="test", repo="repo")
+        repo = make_repo(owner="test", repo="repo")
         failure = FailureInfo(
             repository=repo,
             package_name="test-pkg",
@@ -187,53 +215,22 @@ class TestFailureInfo:
 class TestFetcherResult:
     """Tests for FetcherResult model."""
 
-    def test_create_fetcher_result(self):
+    def test_create_fetcher_result(self, empty_stats):
         """Test creating fetcher result."""
-        stats = FetcherStats()
-        result = FetcherResult(stats=stats, packages=[], failed_downloads=[], version_mapping={})
+        result = FetcherResult(
+            stats=empty_stats, packages=[], failed_downloads=[], version_mapping={}
+        )
 
-        assert result.stats == stats
+        assert result.stats == empty_stats
         assert result.packages == []
         assert result.failed_downloads == []
         assert result.version_mapping == {}
         assert result.unmapped_packages == []
 
-    def test_fetcher_result_success(self):
+    def test_fetcher_result_success(self, make_result):
         """Test success property."""
-        stats = FetcherStats(sboms_failed_permanent=0, sboms_failed_transient=0)
-        result = FetcherResult(stats=stats, packages=[], failed_downloads=[], version_mapping={})
-        assert result.success is True
+        assert make_result().success is True
 
-    def test_fetcher_result_failure(self):
+    def test_fetcher_result_failure(self, make_result):
         """Test success property with failures."""
-        stats = FetcherStats(sboms_failed_permanent=1)
-        result = FetcherResult(stats=stats, packages=[], failed_downloads=[], version_mapping={})
-        assert result.success is False
-
-    def test_github_repository_validation_empty_owner(self):
-        """Test GitHubRepository validation fails for empty owner."""
-        import pytest
-
-        with pytest.raises(ValueError, match="Owner and repo must be non-empty"):
-            GitHubRepository(owner="", repo="test")
-
-    def test_package_dependency_validation_empty_name(self):
-        """Test PackageDependency validation fails for empty name."""
-        import pytest
-
-        with pytest.raises(ValueError, match="Package name cannot be empty"):
-            PackageDependency(name="", version="1.0.0", ecosystem="npm", purl="pkg:npm/test@1.0.0")
-
-    def test_package_dependency_validation_empty_purl(self):
-        """Test PackageDependency validation fails for empty purl."""
-        import pytest
-
-        with pytest.raises(ValueError, match="PURL cannot be empty"):
-            PackageDependency(name="test", version="1.0.0", ecosystem="npm", purl="")
-
-    def test_package_dependency_validation_empty_ecosystem(self):
-        """Test PackageDependency validation fails for empty ecosystem."""
-        import pytest
-
-        with pytest.raises(ValueError, match="Ecosystem cannot be empty"):
-            PackageDependency(name="test", version="1.0.0", ecosystem="", purl="pkg:npm/test@1.0.0")
+        assert make_result(FetcherStats(sboms_failed_permanent=1)).success is False
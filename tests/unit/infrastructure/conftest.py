@@ -0,0 +1,12 @@
+"""Shared fixtures for infrastructure tests."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def sbom_clean_env(monkeypatch):
+    """Remove any SBOM_FETCHER_* variables so Config falls back to defaults."""
+    for key in [key for key in os.environ if key.startswith("SBOM_FETCHER_")]:
+        monkeypatch.delenv(key)
@@ -1,179 +1,160 @@
 """Comprehensive unit tests for configuration - Complete Coverage."""
 
-import os
+import dataclasses
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from sbom_fetcher.domain.exceptions import InvalidConfigError
 from sbom_fetcher.infrastructure.config import Config
 
+DEFAULTS = {
+    "github_api_url": "https://api.github.com",
+    "npm_registry_url": "https://registry.npmjs.org",
+    "pypi_api_url": "https://pypi.org/pypi",
+    "output_dir": Path("sboms"),
+    "key_file": Path("keys.json"),
+    "http_cache_dir": None,
+    "max_retries": 2,
+    "timeout": 30,
+    "rate_limit_pause": 0.5,
+    "max_workers": 8,
+    "log_level": "INFO",
+}
+
 
 class TestConfigDefaults:
     """Tests for default configuration values."""
 
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default configuration values."""
-        config = Config()
-
-        assert config.github_api_url == "https://api.github.com"
-        assert config.npm_registry_url == "https://registry.npmjs.org"
-        assert config.pypi_api_url == "https://pypi.org/pypi"
-        assert config.output_dir == Path("sboms")
-        assert config.key_file == Path("keys.json")
-        assert config.max_retries == 2
-        assert config.timeout == 30
-        assert config.rate_limit_pause == 0.5
-        assert config.log_level == "INFO"
-
-    def test_config_with_custom_values(self):
-        """Test creating config with custom values."""
-        config = Config(
-            github_api_url="https://custom.github.com",
-            npm_registry_url="https://custom.npm.org",
-            timeout=45,
-            max_retries=5,
-            log_level="DEBUG",
-        )
+        assert dataclasses.asdict(default_config) == DEFAULTS
 
-        assert config.github_api_url == "https://custom.github.com"
-        assert config.npm_registry_url == "https://custom.npm.org"
-        assert config.timeout == 45
-        assert config.max_retries == 5
-        assert config.log_level == "DEBUG"
+    def test_config_with_custom_values(self, default_config):
+        """Test overriding some values keeps defaults for the rest."""
+        overrides = {
+            "github_api_url": "https://custom.github.com",
+            "npm_registry_url": "https://custom.npm.org",
+            "timeout": 45,
+            "max_retries": 5,
+            "log_level": "DEBUG",
+        }
+
+        config = dataclasses.replace(default_config, **overrides)
+
+        assert dataclasses.asdict(config) == {**DEFAULTS, **overrides}
 
 
 class TestConfigFromEnv:
     """Tests for loading configuration from environment variables."""
 
-    def test_from_env_no_vars_set(self):
+    def test_from_env_no_vars_set(self, sbom_clean_env):
         """Test from_env with no environment variables set."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config.from_env()
-
-            # Should use defaults
-            assert config.github_api_url == "https://api.github.com"
-            assert config.timeout == 30
-
-    def test_from_env_github_api_url(self):
-        """Test loading GitHub API URL from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_GITHUB_API_URL": "https://custom.github.com"}):
-            config = Config.from_env()
-
-            assert config.github_api_url == "https://custom.github.com"
-
-    def test_from_env_npm_registry_url(self):
-        """Test loading NPM registry URL from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_NPM_REGISTRY_URL": "https://custom.npm.org"}):
-            config = Config.from_env()
-
-            assert config.npm_registry_url == "https://custom.npm.org"
-
-    def test_from_env_pypi_api_url(self):
-        """Test loading PyPI API URL from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_PYPI_API_URL": "https://custom.pypi.org"}):
-            config = Config.from_env()
-
-            assert config.pypi_api_url == "https://custom.pypi.org"
-
-    def test_from_env_output_dir(self):
-        """Test loading output directory from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_OUTPUT_DIR": "/custom/path"}):
-            config = Config.from_env()
-
-            assert config.output_dir == Path("/custom/path")
-
-    def test_from_env_key_file(self):
-        """Test loading key file from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_KEY_FILE": "/path/to/keys.json"}):
-            config = Config.from_env()
-
-            assert config.key_file == Path("/path/to/keys.json")
-
-    def test_from_env_max_retries(self):
-        """Test loading max retries from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_MAX_RETRIES": "5"}):
-            config = Config.from_env()
-
-            assert config.max_retries == 5
-
-    def test_from_env_timeout(self):
-        """Test loading timeout from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_TIMEOUT": "60"}):
-            config = Config.from_env()
-
-            assert config.timeout == 60
-
-    def test_from_env_rate_limit_pause(self):
-        """Test loading rate limit pause from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_RATE_LIMIT_PAUSE": "1.5"}):
-            config = Config.from_env()
+        assert dataclasses.asdict(Config.from_env()) == DEFAULTS
+
+    @pytest.mark.parametrize(
+        "env_var,attr,value,expected",
+        [
+            (
+                "SBOM_FETCHER_GITHUB_API_URL",
+                "github_api_url",
+                "https://custom.github.com",
+                "https://custom.github.com",
+            ),
+            (
+                "SBOM_FETCHER_NPM_REGISTRY_URL",
+                "npm_registry_url",
+                "https://custom.npm.org",
+                "https://custom.npm.org",
+            ),
+            (
+                "SBOM_FETCHER_PYPI_API_URL",
+                "pypi_api_url",
+                "https://custom.pypi.org",
+                "https://custom.pypi.org",
+            ),
+            ("SBOM_FETCHER_OUTPUT_DIR", "output_dir", "/custom/path", Path("/custom/path")),
+            (
+                "SBOM_FETCHER_KEY_FILE",
+                "key_file",
+                "/path/to/keys.json",
+                Path("/path/to/keys.json"),
+            ),
+            (
+                "SBOM_FETCHER_HTTP_CACHE_DIR",
+                "http_cache_dir",
+                "/tmp/sbom-cache",
+                Path("/tmp/sbom-cache"),
+            ),
+            ("SBOM_FETCHER_MAX_RETRIES", "max_retries", "5", 5),
+            ("SBOM_FETCHER_TIMEOUT", "timeout", "60", 60),
+            ("SBOM_FETCHER_RATE_LIMIT_PAUSE", "rate_limit_pause", "1.5", 1.5),
+            ("SBOM_FETCHER_MAX_WORKERS", "max_workers", "4", 4),
+            ("SBOM_FETCHER_LOG_LEVEL", "log_level", "DEBUG", "DEBUG"),
+        ],
+    )
+    def test_from_env_single_var(self, monkeypatch, env_var, attr, value, expected):
+        """Test each environment variable is loaded into its config field."""
+        monkeypatch.setenv(env_var, value)
+
+        config = Config.from_env()
+
+        assert getattr(config, attr) == expected
+
+    def test_from_env_multiple_vars(self, monkeypatch):
+        """Test loading multiple environment variables."""
+        monkeypatch.setenv("SBOM_FETCHER_GITHUB_API_URL", "https://custom.github.com")
+        monkeypatch.setenv("SBOM_FETCHER_TIMEOUT", "60")
+        monkeypatch.setenv("SBOM_FETCHER_LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("SBOM_FETCHER_MAX_RETRIES", "5")
 
-            assert config.rate_limit_pause == 1.5
+        config = Config.from_env()
 
-    def test_from_env_log_level(self):
-        """Test loading log level from environment."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_LOG_LEVEL": "DEBUG"}):
-            config = Config.from_env()
+        assert config.github_api_url == "https://custom.github.com"
+        assert config.timeout == 60
+        assert config.log_level == "DEBUG"
+        assert config.max_retries == 5
 
-            assert config.log_level == "DEBUG"
+    @pytest.mark.parametrize(
+        "env_var",
+        [
+            "SBOM_FETCHER_MAX_RETRIES",
+            "SBOM_FETCHER_TIMEOUT",
+            "SBOM_FETCHER_RATE_LIMIT_PAUSE",
+            "SBOM_FETCHER_MAX_WORKERS",
+        ],
+    )
+    def test_from_env_invalid_number(self, monkeypatch, env_var):
+        """Test error handling for non-numeric values in numeric fields."""
+        monkeypatch.setenv(env_var, "invalid")
 
-    def test_from_env_multiple_vars(self):
-        """Test loading multiple environment variables."""
-        with patch.dict(
-            os.environ,
-            {
-                "SBOM_FETCHER_GITHUB_API_URL": "https://custom.github.com",
-                "SBOM_FETCHER_TIMEOUT": "60",
-                "SBOM_FETCHER_LOG_LEVEL": "DEBUG",
-                "SBOM_FETCHER_MAX_RETRIES": "5",
-            },
-        ):
-            config = Config.from_env()
-
-            assert config.github_api_url == "https://custom.github.com"
-            assert config.timeout == 60
-            assert config.log_level == "DEBUG"
-            assert config.max_retries == 5
-
-    def test_from_env_invalid_int(self):
-        """Test error handling for invalid integer value."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_MAX_RETRIES": "invalid"}):
-            with pytest.raises(InvalidConfigError, match="Invalid value"):
-                Config.from_env()
-
-    def test_from_env_invalid_float(self):
-        """Test error handling for invalid float value."""
-        with patch.dict(os.environ, {"SBOM_FETCHER_RATE_LIMIT_PAUSE": "invalid"}):
-            with pytest.raises(InvalidConfigError, match="Invalid value"):
-                Config.from_env()
+        with pytest.raises(InvalidConfigError, match=f"Invalid value for {env_var}: invalid"):
+            Config.from_env()
 
 
 class TestConfigLoad:
     """Tests for load method."""
 
-    def test_load_no_config_file(self):
+    def test_load_no_config_file(self, sbom_clean_env):
         """Test load with no config file."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config.load()
-
-            assert config.github_api_url == "https://api.github.com"
-            assert config.timeout == 30
+        assert dataclasses.asdict(Config.load()) == DEFAULTS
 
-    def test_load_with_env_vars(self):
+    def test_load_with_env_vars(self, monkeypatch):
         """Test load respects environment variables."""
-        with patch.dict(
-            os.environ,
-            {
-                "SBOM_FETCHER_GITHUB_API_URL": "https://custom.github.com",
-                "SBOM_FETCHER_TIMEOUT": "60",
-            },
-        ):
-            config = Config.load()
-
-            assert config.github_api_url == "https://custom.github.com"
-            assert config.timeout == 60
+        monkeypatch.setenv("SBOM_FETCHER_GITHUB_API_URL", "https://custom.github.com")
+        monkeypatch.setenv("SBOM_FETCHER_TIMEOUT", "60")
+
+        config = Config.load()
+
+        assert config.github_api_url == "https://custom.github.com"
+        assert config.timeout == 60
+
+    def test_load_rejects_zero_max_workers(self, monkeypatch):
+        """Test load validates values from the environment."""
+        monkeypatch.setenv("SBOM_FETCHER_MAX_WORKERS", "0")
+
+        with pytest.raises(InvalidConfigError, match="max_workers must be at least 1"):
+            Config.load()
 
     def test_load_with_config_file_parameter(self):
         """Test load accepts config_file parameter (not yet implemented)."""
@@ -187,45 +168,28 @@ class TestConfigLoad:
 class TestConfigValidation:
     """Tests for configuration validation."""
 
-    def test_validate_valid_config(self):
+    def test_validate_valid_config(self, default_config):
         """Test validation passes for valid config."""
-        config = Config()
-        config.validate()  # Should not raise
-
-    def test_validate_negative_max_retries(self):
-        """Test validation fails for negative max_retries."""
-        config = Config(max_retries=-1)
-
-        with pytest.raises(InvalidConfigError, match="max_retries must be non-negative"):
-            config.validate()
-
-    def test_validate_zero_timeout(self):
-        """Test validation fails for zero timeout."""
-        config = Config(timeout=0)
-
-        with pytest.raises(InvalidConfigError, match="timeout must be positive"):
+        default_config.validate()  # Should not raise
+
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"max_retries": -1}, "max_retries must be non-negative"),
+            ({"timeout": 0}, "timeout must be positive"),
+            ({"timeout": -10}, "timeout must be positive"),
+            ({"rate_limit_pause": -1.0}, "rate_limit_pause must be non-negative"),
+            ({"max_workers": 0}, "max_workers must be at least 1"),
+        ],
+    )
+    def test_validate_rejects_invalid_values(self, kwargs, match):
+        """Test validation fails for out-of-range values."""
+        config = Config(**kwargs)
+
+        with pytest.raises(InvalidConfigError, match=match):
             config.validate()
 
-    def test_validate_negative_timeout(self):
-        """Test validation fails for negative timeout."""
-        config = Config(timeout=-10)
-
-        with pytest.raises(InvalidConfigError, match="timeout must be positive"):
-            config.validate()
-
-    def test_validate_negative_rate_limit_pause(self):
-        """Test validation fails for negative rate_limit_pause."""
-        config = Config(rate_limit_pause=-1.0)
-
-        with pytest.raises(InvalidConfigError, match="rate_limit_pause must be non-negative"):
-            config.validate()
-
-    def test_validate_zero_rate_limit_pause_allowed(self):
-        """Test validation allows zero rate_limit_pause."""
-        config = Config(rate_limit_pause=0.0)
-        config.validate()  # Should not raise
-
-    def test_validate_zero_max_retries_allowed(self):
-        """Test validation allows zero max_retries."""
-        config = Config(max_retries=0)
-        config.validate()  # Should not raise
+    @pytest.mark.parametrize("kwargs", [{"rate_limit_pause": 0.0}, {"max_retries": 0}])
+    def test_validate_allows_zero(self, kwargs):
+        """Test validation allows zero where the field is non-negative."""
+        Config(**kwargs).validate()  # Should not raise
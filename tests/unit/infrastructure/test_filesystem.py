@@ -1,7 +1,6 @@
 """Comprehensive unit tests for filesystem repository - Complete Coverage."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -17,98 +16,91 @@ class TestFilesystemSBOMRepository:
     """Tests for FilesystemSBOMRepository."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    @pytest.fixture
-    def repository(self, temp_dir):
+    def repository(self, tmp_path):
         """Create filesystem repository."""
-        return FilesystemSBOMRepository(temp_dir)
+        return FilesystemSBOMRepository(tmp_path)
 
-    def test_initialization(self, temp_dir):
+    def test_initialization(self, tmp_path):
         """Test repository initialization creates directory."""
-        repo = FilesystemSBOMRepository(temp_dir)
+        repo = FilesystemSBOMRepository(tmp_path)
 
-        assert repo._base_dir == temp_dir
-        assert temp_dir.exists()
+        assert repo._base_dir == tmp_path
+        assert tmp_path.exists()
 
-    def test_initialization_creates_directory(self):
+    def test_initialization_creates_directory(self, tmp_path):
         """Test repository creates non-existent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            new_dir = Path(tmpdir) / "subdir" / "nested"
-            repo = FilesystemSBOMRepository(new_dir)
+        new_dir = tmp_path / "subdir" / "nested"
+        repo = FilesystemSBOMRepository(new_dir)
 
-            assert new_dir.exists()
-            assert repo._base_dir == new_dir
+        assert new_dir.exists()
+        assert repo._base_dir == new_dir
 
-    def test_save_sbom_success(self, repository, temp_dir):
+    def test_save_sbom_success(self, repository, tmp_path):
         """Test successfully saving SBOM."""
         sbom_data = {"sbom": {"packages": []}}
 
         filepath = repository.save_sbom(sbom_data, "test-sbom")
 
         assert filepath.exists()
-        assert filepath == temp_dir / "test-sbom.json"
+        assert filepath == tmp_path / "test-sbom.json"
 
         with open(filepath) as f:
             loaded_data = json.load(f)
             assert loaded_data == sbom_data
 
-    def test_save_sbom_with_subdirectory(self, repository, temp_dir):
+    def test_save_sbom_with_subdirectory(self, repository, tmp_path):
         """Test saving SBOM to subdirectory."""
         sbom_data = {"test": "data"}
 
         filepath = repository.save_sbom(sbom_data, "test", subdirectory="deps")
 
         assert filepath.exists()
-        assert filepath == temp_dir / "deps" / "test.json"
-        assert (temp_dir / "deps").exists()
+        assert filepath == tmp_path / "deps" / "test.json"
+        assert (tmp_path / "deps").exists()
 
-    def test_save_sbom_creates_subdirectory(self, repository, temp_dir):
+    def test_save_sbom_creates_subdirectory(self, repository, tmp_path):
         """Test saving SBOM creates nested subdirectories."""
         sbom_data = {"test": "data"}
 
         filepath = repository.save_sbom(sbom_data, "test", subdirectory="level1/level2/level3")
 
         assert filepath.exists()
-        assert (temp_dir / "level1" / "level2" / "level3").exists()
+        assert (tmp_path / "level1" / "level2" / "level3").exists()
 
-    def test_save_mapping_success(self, repository, temp_dir):
+    def test_save_mapping_success(self, repository, tmp_path):
         """Test successfully saving mapping."""
         mapping = {"repo1": {"versions": ["1.0.0", "1.0.1"]}}
 
         filepath = repository.save_mapping(mapping, "version-mapping")
 
         assert filepath.exists()
-        assert filepath == temp_dir / "version-mapping.json"
+        assert filepath == tmp_path / "version-mapping.json"
 
         with open(filepath) as f:
             loaded_data = json.load(f)
             assert loaded_data == mapping
 
-    def test_save_report_success(self, repository, temp_dir):
+    def test_save_report_success(self, repository, tmp_path):
         """Test successfully saving report."""
         report_content = "# Test Report\n\nThis is a test."
 
         filepath = repository.save_report(report_content, "test-report")
 
         assert filepath.exists()
-        assert filepath == temp_dir / "test-report.md"
+        assert filepath == tmp_path / "test-report.md"
 
         with open(filepath) as f:
             loaded_content = f.read()
             assert loaded_content == report_content
 
-    def test_save_report_custom_format(self, repository, temp_dir):
+    def test_save_report_custom_format(self, repository, tmp_path):
         """Test saving report with custom format."""
         report_content = "Test content"
 
         filepath = repository.save_report(report_content, "test", format="txt")
 
         assert filepath.exists()
-        assert filepath == temp_dir / "test.txt"
+        assert filepath == tmp_path / "test.txt"
 
     def test_save_sbom_io_error(self, repository):
         """Test save_sbom handles IO errors."""
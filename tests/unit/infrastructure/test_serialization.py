@@ -0,0 +1,64 @@
+"""Unit tests for JSON serialization helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from sbom_fetcher.infrastructure.serialization import dumps_json, write_json
+
+SBOM = {
+    "spdxVersion": "SPDX-2.3",
+    "name": "café",
+    "packages": [{"name": f"pkg-{i}", "versionInfo": "1.0.0"} for i in range(3)],
+    "relationships": [],
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch("sbom_fetcher.infrastructure.serialization.orjson", None):
+            yield
+
+
+class TestDumpsJson:
+    """Tests for dumps_json."""
+
+    def test_matches_stdlib_indented_output(self, backend):
+        """Test both backends produce the same bytes as json.dumps(indent=2)."""
+        expected = json.dumps(SBOM, indent=2, ensure_ascii=False).encode("utf-8")
+
+        assert dumps_json(SBOM) == expected
+
+    @pytest.mark.parametrize(
+        "data",
+        [{"size": 2**70}, {1: "one", None: "none"}],
+        ids=["big-int", "non-str-keys"],
+    )
+    def test_stdlib_compatible_data_serializes(self, backend, data):
+        """Test data orjson rejects but json accepts still serializes on both backends."""
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        assert dumps_json(data) == expected
+
+    def test_unserializable_raises_type_error(self, backend):
+        """Test unsupported values fail the same way on both backends."""
+        with pytest.raises(TypeError):
+            dumps_json({"value": object()})
+
+
+class TestWriteJson:
+    """Tests for write_json."""
+
+    def test_round_trip(self, backend, tmp_path):
+        """Test written files load back to the original data."""
+        path = tmp_path / "sbom.json"
+
+        write_json(path, SBOM)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == SBOM
@@ -1,6 +1,5 @@
 """Tests for component count reporting feature."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -17,12 +16,6 @@ class TestComponentCountReporting:
         """Create reporter instance."""
         return MarkdownReporter()
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     @pytest.fixture
     def basic_stats(self):
         """Basic statistics fixture."""
@@ -60,7 +53,7 @@ class TestComponentCountReporting:
         return [pkg1, pkg2, pkg3]
 
     def test_component_count_with_root_and_dependencies(
-        self, reporter, temp_dir, basic_stats, sample_packages
+        self, reporter, tmp_path, basic_stats, sample_packages
     ):
         """Test report includes component count analysis with root and dependencies."""
         version_mapping = {
@@ -86,8 +79,8 @@ class TestComponentCountReporting:
             "pallets/click": 13,
         }
 
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test-owner",
             repo="test-repo",
             stats=basic_stats,
@@ -99,8 +92,6 @@ class TestComponentCountReporting:
             dependency_component_counts=dependency_component_counts,
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Check component count analysis section exists
         assert "## Component Count Analysis" in content
         assert "Root SBOM: `test-owner/test-repo`" in content
@@ -122,7 +113,7 @@ class TestComponentCountReporting:
         assert "**🎯 Grand Total (Root + 1st level Dependencies):** **107 components**" in content
 
     def test_component_count_sorted_by_count(
-        self, reporter, temp_dir, basic_stats, sample_packages
+        self, reporter, tmp_path, basic_stats, sample_packages
     ):
         """Test dependencies are sorted by component count descending."""
         version_mapping = {
@@ -136,8 +127,8 @@ class TestComponentCountReporting:
             "psf/requests": 28,  # Middle
         }
 
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="owner",
             repo="repo",
             stats=basic_stats,
@@ -149,8 +140,6 @@ class TestComponentCountReporting:
             dependency_component_counts=dependency_component_counts,
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Find positions in the content
         pytest_pos = content.find("pytest-dev/pytest")
         requests_pos = content.find("psf/requests")
@@ -159,13 +148,13 @@ class TestComponentCountReporting:
         # Verify order: pytest (44) should come before requests (28) before click (13)
         assert pytest_pos < requests_pos < click_pos
 
-    def test_component_count_without_package_info(self, reporter, temp_dir, basic_stats):
+    def test_component_count_without_package_info(self, reporter, tmp_path, basic_stats):
         """Test component count when version_mapping lacks package info."""
         version_mapping = {"owner/repo": {}}  # Missing package_name and ecosystem
         dependency_component_counts = {"owner/repo": 15}
 
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test",
             repo="test",
             stats=basic_stats,
@@ -177,16 +166,14 @@ class TestComponentCountReporting:
             dependency_component_counts=dependency_component_counts,
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Should still show the repo, just without ecosystem/package info
         assert "owner/repo" in content
         assert "15 components" in content
 
-    def test_component_count_with_only_root(self, reporter, temp_dir, basic_stats):
+    def test_component_count_with_only_root(self, reporter, tmp_path, basic_stats):
         """Test component count with only root SBOM, no dependencies."""
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test",
             repo="test",
             stats=basic_stats,
@@ -198,8 +185,6 @@ class TestComponentCountReporting:
             dependency_component_counts={},
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Should show component count analysis
         assert "## Component Count Analysis" in content
         assert "Root SBOM: `test/test`" in content
@@ -209,10 +194,10 @@ class TestComponentCountReporting:
         assert "### Dependency SBOMs" not in content
         assert "### Grand Total" not in content
 
-    def test_component_count_none_defaults(self, reporter, temp_dir, basic_stats):
+    def test_component_count_none_defaults(self, reporter, tmp_path, basic_stats):
         """Test component count with None defaults (backward compatibility)."""
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test",
             repo="test",
             stats=basic_stats,
@@ -223,15 +208,13 @@ class TestComponentCountReporting:
             # Not passing root_component_count or dependency_component_counts
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Should not show component count analysis section
         assert "## Component Count Analysis" not in content
 
-    def test_component_count_with_zero_counts(self, reporter, temp_dir, basic_stats):
+    def test_component_count_with_zero_counts(self, reporter, tmp_path, basic_stats):
         """Test component count with all zeros."""
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test",
             repo="test",
             stats=basic_stats,
@@ -243,12 +226,10 @@ class TestComponentCountReporting:
             dependency_component_counts={},
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Should not show component count analysis when all zeros
         assert "## Component Count Analysis" not in content
 
-    def test_component_count_grand_total_calculation(self, reporter, temp_dir, basic_stats):
+    def test_component_count_grand_total_calculation(self, reporter, tmp_path, basic_stats):
         """Test grand total calculation is correct."""
         version_mapping = {
             "repo1": {"package_name": "pkg1", "ecosystem": "npm"},
@@ -261,8 +242,8 @@ class TestComponentCountReporting:
             "repo3": 300,
         }
 
-        filename = reporter.generate(
-            output_dir=temp_dir,
+        content = reporter.render(
+            output_dir=tmp_path,
             owner="test",
             repo="test",
             stats=basic_stats,
@@ -274,8 +255,6 @@ class TestComponentCountReporting:
             dependency_component_counts=dependency_component_counts,
         )
 
-        content = (temp_dir / filename).read_text()
-
         # Root: 50, Dependencies: 100+200+300=600, Grand Total: 650
         assert "**Root SBOM components:** 50" in content
         assert "**1st level dependency SBOM components:** 600" in content
@@ -1,6 +1,12 @@
 """Tests for count_sbom_components helper function."""
 
-from sbom_fetcher.services.sbom_service import count_sbom_components
+from sbom_fetcher.services.parsers import count_sbom_components
+
+# Built once at import; count_sbom_components does not mutate its input
+_LARGE_SBOM = {
+    "spdxVersion": "SPDX-2.3",
+    "packages": [{"name": f"pkg{i}", "version": f"{i}.0"} for i in range(1000)],
+}
 
 
 class TestCountSBOMComponents:
@@ -77,9 +83,7 @@ class TestCountSBOMComponents:
 
     def test_count_components_large_sbom(self):
         """Test counting components with a large SBOM."""
-        packages = [{"name": f"pkg{i}", "version": f"{i}.0"} for i in range(100)]
-        sbom_data = {"spdxVersion": "SPDX-2.3", "packages": packages}
-        assert count_sbom_components(sbom_data) == 100
+        assert count_sbom_components(_LARGE_SBOM) == 1000
 
     def test_count_components_single_package(self):
         """Test counting components with a single package."""
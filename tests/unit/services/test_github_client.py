@@ -1,11 +1,12 @@
 """Comprehensive unit tests for GitHub API client - Complete Coverage."""
 
-import tempfile
+import json
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+import responses
 
 from sbom_fetcher.domain.models import (
     ErrorType,
@@ -14,7 +15,7 @@ from sbom_fetcher.domain.models import (
 )
 from sbom_fetcher.infrastructure.config import Config
 from sbom_fetcher.infrastructure.http_client import RequestsHTTPClient
-from sbom_fetcher.services.github_client import GitHubClient
+from sbom_fetcher.services.github_client import GitHubClient, _status_error
 
 
 class TestGitHubClientInitialization:
@@ -34,7 +35,25 @@ class TestGitHubClientInitialization:
         assert client._api_url == config.github_api_url
         assert isinstance(client._branch_cache, dict)
 
+    @pytest.mark.parametrize(
+        "api_url,graphql_url",
+        [
+            ("https://api.github.com", "https://api.github.com/graphql"),
+            ("https://api.github.com/", "https://api.github.com/graphql"),
+            ("https://ghe.example.com/api/v3", "https://ghe.example.com/api/graphql"),
+            ("https://ghe.example.com/api/v3/", "https://ghe.example.com/api/graphql"),
+        ],
+    )
+    def test_client_graphql_url(self, api_url, graphql_url):
+        """Test the GraphQL endpoint is derived for github.com and Enterprise Server."""
+        config = Config(github_api_url=api_url)
 
+        client = GitHubClient(RequestsHTTPClient(config), "test_token", config)
+
+        assert client._graphql_url == graphql_url
+
+
+@patch("requests.Session")
 class TestFetchRootSBOM:
     """Tests for fetching root repository SBOM."""
 
@@ -45,79 +64,74 @@ class TestFetchRootSBOM:
         http_client = RequestsHTTPClient(config)
         return GitHubClient(http_client, "test_token", config)
 
-    def test_fetch_root_sbom_success(self, client):
+    def test_fetch_root_sbom_success(self, mock_session_class, client):
         """Test successful root SBOM fetch - returns extracted SPDX content."""
         # GitHub API returns wrapped format
         api_response = {"sbom": {"spdxVersion": "SPDX-2.3", "packages": []}}
         # But we expect the extracted SPDX content
         expected_sbom = {"spdxVersion": "SPDX-2.3", "packages": []}
 
-        with patch("requests.Session") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
 
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = api_response
-            mock_session.get.return_value = mock_response
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = api_response
+        mock_session.get.return_value = mock_response
 
-            result = client.fetch_root_sbom("owner", "repo")
+        result = client.fetch_root_sbom("owner", "repo")
 
-            assert result == expected_sbom
-            mock_session.get.assert_called_once()
+        assert result == expected_sbom
+        mock_session.get.assert_called_once()
 
-    def test_fetch_root_sbom_404(self, client):
+    def test_fetch_root_sbom_404(self, mock_session_class, client):
         """Test root SBOM fetch when dependency graph not enabled."""
-        with patch("requests.Session") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
 
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_session.get.return_value = mock_response
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_session.get.return_value = mock_response
 
-            result = client.fetch_root_sbom("owner", "repo")
+        result = client.fetch_root_sbom("owner", "repo")
 
-            assert result is None
+        assert result is None
 
-    def test_fetch_root_sbom_403(self, client):
+    def test_fetch_root_sbom_403(self, mock_session_class, client):
         """Test root SBOM fetch when access forbidden."""
-        with patch("requests.Session") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
 
-            mock_response = Mock()
-            mock_response.status_code = 403
-            mock_session.get.return_value = mock_response
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_session.get.return_value = mock_response
 
-            result = client.fetch_root_sbom("owner", "repo")
+        result = client.fetch_root_sbom("owner", "repo")
 
-            assert result is None
+        assert result is None
 
-    def test_fetch_root_sbom_500(self, client):
+    def test_fetch_root_sbom_500(self, mock_session_class, client):
         """Test root SBOM fetch with server error."""
-        with patch("requests.Session") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
 
-            mock_response = Mock()
-            mock_response.status_code = 500
-            mock_session.get.return_value = mock_response
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_session.get.return_value = mock_response
 
-            result = client.fetch_root_sbom("owner", "repo")
+        result = client.fetch_root_sbom("owner", "repo")
 
-            assert result is None
+        assert result is None
 
-    def test_fetch_root_sbom_request_exception(self, client):
+    def test_fetch_root_sbom_request_exception(self, mock_session_class, client):
         """Test root SBOM fetch handles request exceptions."""
-        with patch("requests.Session") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.get.side_effect = requests.RequestException("Network error")
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.side_effect = requests.RequestException("Network error")
 
-            result = client.fetch_root_sbom("owner", "repo")
+        result = client.fetch_root_sbom("owner", "repo")
 
-            assert result is None
+        assert result is None
 
 
 class TestGetDefaultBranch:
@@ -207,8 +221,8 @@ class TestGetDefaultBranch:
         assert branch == "main"
 
 
-class TestDownloadDependencySBOM:
-    """Tests for downloading dependency SBOMs."""
+class TestPrefetchDefaultBranches:
+    """Tests for batched GraphQL default branch lookups."""
 
     @pytest.fixture
     def client(self):
@@ -223,319 +237,332 @@ class TestDownloadDependencySBOM:
         return Mock(spec=requests.Session)
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    def repos(self):
+        """Three distinct repositories."""
+        return [GitHubRepository(owner="org", repo=f"repo{i}") for i in range(3)]
+
+    def test_prefetch_fills_cache_in_chunks(self, client, mock_session, repos):
+        """Test one POST per chunk and branch names land in the cache."""
+        first = Mock(status_code=200)
+        first.json.return_value = {
+            "data": {
+                "r0": {"defaultBranchRef": {"name": "main"}},
+                "r1": {"defaultBranchRef": {"name": "develop"}},
+            }
+        }
+        second = Mock(status_code=200)
+        second.json.return_value = {"data": {"r0": {"defaultBranchRef": {"name": "master"}}}}
+        mock_session.post.side_effect = [first, second]
+
+        client.prefetch_default_branches(mock_session, repos + repos[:1], chunk=2)
+
+        assert mock_session.post.call_count == 2
+        assert mock_session.post.call_args_list[0].args == ("https://api.github.com/graphql",)
+        assert client._branch_cache == {
+            "org/repo0": "main",
+            "org/repo1": "develop",
+            "org/repo2": "master",
+        }
+        assert client.get_default_branch(mock_session, "org", "repo1") == "develop"
+        mock_session.get.assert_not_called()
+
+    def test_prefetch_skips_cached_and_missing(self, client, mock_session, repos):
+        """Test cached repos are not queried and null results stay uncached."""
+        client._branch_cache["org/repo0"] = "trunk"
+        response = Mock(status_code=200)
+        response.json.return_value = {"data": {"r0": None, "r1": {"defaultBranchRef": None}}}
+        mock_session.post.return_value = response
+
+        client.prefetch_default_branches(mock_session, repos)
+
+        query = mock_session.post.call_args.kwargs["json"]["query"]
+        assert '"repo0"' not in query
+        assert client._branch_cache == {"org/repo0": "trunk"}
+
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            Mock(status_code=502),
+            requests.Timeout("slow"),
+            Mock(status_code=200, json=Mock(return_value={"errors": [{"message": "boom"}]})),
+        ],
+        ids=["http-error", "request-exception", "graphql-errors"],
+    )
+    def test_prefetch_failed_chunk_skips_only_that_chunk(
+        self, client, mock_session, repos, outcome
+    ):
+        """Test a failed chunk stays uncached while later chunks are still fetched."""
+        second = Mock(status_code=200)
+        second.json.return_value = {"data": {"r0": {"defaultBranchRef": {"name": "develop"}}}}
+        third = Mock(status_code=200)
+        third.json.return_value = {"data": {"r0": {"defaultBranchRef": {"name": "main"}}}}
+        mock_session.post.side_effect = [outcome, second, third]
 
-    def test_download_without_github_repo(self, client, mock_session, temp_dir):
-        """Test download fails when package has no GitHub repository."""
-        pkg = PackageDependency(
-            name="test-pkg", version="1.0.0", ecosystem="npm", purl="pkg:npm/test-pkg@1.0.0"
-        )
+        client.prefetch_default_branches(mock_session, repos, chunk=1)
 
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        assert mock_session.post.call_count == 3
+        assert client._branch_cache == {"org/repo1": "develop", "org/repo2": "main"}
 
-        assert result is False
-        assert pkg.error == "No GitHub repository mapped"
-        assert pkg.sbom_downloaded is False
 
-    def test_download_success(self, client, mock_session, temp_dir):
-        """Test successful SBOM download."""
-        repo = GitHubRepository(owner="lodash", repo="lodash")
-        pkg = PackageDependency(
-            name="lodash",
-            version="4.17.21",
-            ecosystem="npm",
-            purl="pkg:npm/lodash@4.17.21",
-            github_repository=repo,
-        )
+_SBOM_URL = "https://api.github.com/repos/{owner}/{repo}/dependency-graph/sbom"
+_REPO_URL = "https://api.github.com/repos/{owner}/{repo}"
 
-        # Mock SBOM download
-        sbom_response = Mock()
-        sbom_response.status_code = 200
-        sbom_response.json.return_value = {"sbom": {"packages": []}}
 
-        # Mock default branch call
-        branch_response = Mock()
-        branch_response.status_code = 200
-        branch_response.json.return_value = {"default_branch": "main"}
+class TestDownloadDependencySBOM:
+    """Tests for downloading dependency SBOMs against a real session and mocked transport."""
 
-        mock_session.get.side_effect = [sbom_response, branch_response]
+    @pytest.fixture
+    def client(self):
+        """Create GitHub client for testing."""
+        config = Config()
+        http_client = RequestsHTTPClient(config)
+        return GitHubClient(http_client, "test_token", config)
 
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+    @pytest.fixture
+    def session(self):
+        """Create a plain requests session (no retry adapter)."""
+        return requests.Session()
 
-        assert result is True
-        assert pkg.sbom_downloaded is True
-        assert pkg.error is None
+    @pytest.fixture
+    def http(self):
+        """Intercept requests at the adapter layer; every registered route must be hit."""
+        with responses.RequestsMock() as rsps:
+            yield rsps
 
-        # Verify file was created
-        expected_file = Path(temp_dir) / "lodash_lodash_main.json"
-        assert expected_file.exists()
+    @pytest.fixture
+    def temp_dir(self, fs):
+        """Create an output directory on an in-memory filesystem."""
+        return fs.create_dir("/out").path
 
-    def test_download_404_error(self, client, mock_session, temp_dir):
-        """Test download handles 404 (dependency graph not enabled)."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
+    @pytest.fixture
+    def pkg(self):
+        """Package mapped to test/repo."""
+        return PackageDependency(
             name="test-pkg",
             version="1.0.0",
             ecosystem="npm",
             purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+            github_repository=GitHubRepository(owner="test", repo="repo"),
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_session.get.return_value = mock_response
-
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
-
-        assert result is False
-        assert pkg.error == "Dependency graph not enabled"
-        assert pkg.error_type == ErrorType.PERMANENT
-        assert pkg.sbom_downloaded is False
-
-    def test_download_403_error(self, client, mock_session, temp_dir):
-        """Test download handles 403 (forbidden)."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+    @staticmethod
+    def _add_sbom(http, owner, repo, branch="main", packages=()):
+        """Register a successful SBOM download plus its default-branch lookup."""
+        http.add(
+            responses.GET,
+            _SBOM_URL.format(owner=owner, repo=repo),
+            json={"sbom": {"packages": list(packages)}},
         )
-
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_session.get.return_value = mock_response
-
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
-
-        assert result is False
-        assert pkg.error == "Access forbidden"
-        assert pkg.error_type == ErrorType.PERMANENT
-
-    def test_download_500_retry_success(self, client, mock_session, temp_dir):
-        """Test download retries on 500 error and succeeds."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+        http.add(
+            responses.GET,
+            _REPO_URL.format(owner=owner, repo=repo),
+            json={"default_branch": branch},
         )
 
-        # First call: 500 error
-        error_response = Mock()
-        error_response.status_code = 500
-
-        # Second call: success
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"sbom": {"packages": []}}
-
-        # Branch call
-        branch_response = Mock()
-        branch_response.status_code = 200
-        branch_response.json.return_value = {"default_branch": "main"}
-
-        mock_session.get.side_effect = [error_response, success_response, branch_response]
-
-        with patch("time.sleep"):  # Speed up test
-            result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
-
-        assert result is True
-        assert pkg.sbom_downloaded is True
-        assert mock_session.get.call_count >= 2
-
-    def test_download_500_max_retries(self, client, mock_session, temp_dir):
-        """Test download exhausts retries on persistent 500 errors."""
-        repo = GitHubRepository(owner="test", repo="repo")
+    def test_download_without_github_repo(self, client, session, http, temp_dir):
+        """Test download fails when package has no GitHub repository."""
         pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+            name="test-pkg", version="1.0.0", ecosystem="npm", purl="pkg:npm/test-pkg@1.0.0"
         )
 
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_session.get.return_value = mock_response
-
-        with patch("time.sleep"):  # Speed up test
-            result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
         assert result is False
-        assert pkg.error == "HTTP 500"
-        assert pkg.error_type == ErrorType.TRANSIENT
+        assert pkg.error == "No GitHub repository mapped"
         assert pkg.sbom_downloaded is False
+        assert len(http.calls) == 0
 
-    def test_download_429_rate_limit_retry(self, client, mock_session, temp_dir):
-        """Test download handles rate limiting with retry."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
-        )
-
-        # First: rate limited
-        rate_limit_response = Mock()
-        rate_limit_response.status_code = 429
-
-        # Second: success
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"sbom": {"packages": []}}
-
-        # Branch call
-        branch_response = Mock()
-        branch_response.status_code = 200
-        branch_response.json.return_value = {"default_branch": "main"}
-
-        mock_session.get.side_effect = [rate_limit_response, success_response, branch_response]
-
-        with patch("time.sleep"):
-            result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
-
-        assert result is True
-        assert pkg.sbom_downloaded is True
-
-    def test_download_success_with_slash_in_branch_name(self, client, mock_session, temp_dir):
-        """Test SBOM download sanitizes branch names containing slashes."""
-        repo = GitHubRepository(owner="cdklabs", repo="awscdk-asset-awscli")
+    def test_download_success(self, client, session, http, temp_dir):
+        """Test successful SBOM download."""
         pkg = PackageDependency(
-            name="@aws-cdk/asset-awscli-v1",
-            version="2.2.242",
+            name="lodash",
+            version="4.17.21",
             ecosystem="npm",
-            purl="pkg:npm/@aws-cdk/asset-awscli-v1@2.2.242",
-            github_repository=repo,
+            purl="pkg:npm/lodash@4.17.21",
+            github_repository=GitHubRepository(owner="lodash", repo="lodash"),
         )
+        self._add_sbom(http, "lodash", "lodash", packages=[{"name": "lodash"}])
 
-        # Mock SBOM download
-        sbom_response = Mock()
-        sbom_response.status_code = 200
-        sbom_response.json.return_value = {"sbom": {"packages": []}}
-
-        # Mock default branch call - branch name contains a slash
-        branch_response = Mock()
-        branch_response.status_code = 200
-        branch_response.json.return_value = {"default_branch": "awscli-v1/main"}
-
-        mock_session.get.side_effect = [sbom_response, branch_response]
-
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
         assert result is True
         assert pkg.sbom_downloaded is True
+        assert pkg.error is None
+        assert pkg.sbom_file == "lodash_lodash_main.json"
+        assert pkg.sbom_component_count == 1
 
-        # Verify file was created with sanitized branch name (slash replaced with underscore)
-        expected_file = Path(temp_dir) / "cdklabs_awscdk-asset-awscli_awscli-v1_main.json"
-        assert (
-            expected_file.exists()
-        ), f"Expected {expected_file} but found: {list(Path(temp_dir).iterdir())}"
-
-    def test_download_success_with_multiple_slashes_in_branch_name(
-        self, client, mock_session, temp_dir
+        # Verify the unwrapped SPDX document was written
+        expected_file = Path(temp_dir) / "lodash_lodash_main.json"
+        assert json.loads(expected_file.read_text()) == {"packages": [{"name": "lodash"}]}
+
+    @pytest.mark.parametrize(
+        "status,error,error_type",
+        [
+            (404, "Dependency graph not enabled", ErrorType.PERMANENT),
+            (403, "Access forbidden", ErrorType.PERMANENT),
+            (410, "HTTP 410", ErrorType.PERMANENT),
+            (429, "Rate limited", ErrorType.TRANSIENT),
+            (500, "HTTP 500", ErrorType.TRANSIENT),
+        ],
+    )
+    def test_download_error_status(
+        self, client, session, http, temp_dir, pkg, status, error, error_type
     ):
-        """Test SBOM download sanitizes branch names with multiple slashes."""
-        repo = GitHubRepository(owner="owner", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
-        )
-
-        # Mock SBOM download
-        sbom_response = Mock()
-        sbom_response.status_code = 200
-        sbom_response.json.return_value = {"sbom": {"packages": []}}
-
-        # Mock default branch call - branch name contains multiple slashes
-        branch_response = Mock()
-        branch_response.status_code = 200
-        branch_response.json.return_value = {"default_branch": "feature/v2/release"}
-
-        mock_session.get.side_effect = [sbom_response, branch_response]
+        """Test non-200 responses are classified without client-side retries."""
+        http.add(responses.GET, _SBOM_URL.format(owner="test", repo="repo"), status=status)
 
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
-        assert result is True
-        assert pkg.sbom_downloaded is True
-
-        # Verify file was created with all slashes replaced
-        expected_file = Path(temp_dir) / "owner_repo_feature_v2_release.json"
-        assert expected_file.exists()
-
-    def test_download_429_rate_limit_exhausted(self, client, mock_session, temp_dir):
-        """Test download fails after exhausting retries on rate limiting."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+        assert result is False
+        assert pkg.error == error
+        assert pkg.error_type == error_type
+        assert pkg.sbom_downloaded is False
+        # Retries belong to the session's adapter, not the client
+        assert len(http.calls) == 1
+
+    @pytest.mark.parametrize(
+        "headers",
+        [{"Retry-After": "60"}, {"X-RateLimit-Remaining": "0"}],
+        ids=["secondary-limit", "primary-limit"],
+    )
+    def test_download_rate_limited_403_is_transient(
+        self, client, session, http, temp_dir, pkg, headers
+    ):
+        """Test a throttling 403 is reported as a transient rate limit, not forbidden."""
+        http.add(
+            responses.GET,
+            _SBOM_URL.format(owner="test", repo="repo"),
+            status=403,
+            headers=headers,
         )
 
-        # All calls return rate limited
-        rate_limit_response = Mock()
-        rate_limit_response.status_code = 429
-        mock_session.get.return_value = rate_limit_response
-
-        with patch("time.sleep"):
-            result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
         assert result is False
         assert pkg.error == "Rate limited"
         assert pkg.error_type == ErrorType.TRANSIENT
 
-    def test_download_other_4xx_error(self, client, mock_session, temp_dir):
-        """Test download handles other 4xx client errors as permanent."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
-        )
-
-        # Return 410 Gone
-        mock_response = Mock()
-        mock_response.status_code = 410
-        mock_session.get.return_value = mock_response
-
-        result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+    def test_error_status_classification_shared(self):
+        """Test repeated failures with the same status reuse one classification."""
+        assert _status_error(502) is _status_error(502)
+        assert _status_error(404) is _status_error(404)
+
+    @pytest.mark.parametrize(
+        "branch,filename",
+        [
+            ("awscli-v1/main", "test_repo_awscli-v1_main.json"),
+            ("feature/v2/release", "test_repo_feature_v2_release.json"),
+        ],
+    )
+    def test_download_sanitizes_branch_name(
+        self, client, session, http, temp_dir, pkg, branch, filename
+    ):
+        """Test slashes in the default branch are replaced in the SBOM file name."""
+        self._add_sbom(http, "test", "repo", branch=branch)
 
-        assert result is False
-        assert pkg.error == "HTTP 410"
-        assert pkg.error_type == ErrorType.PERMANENT
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
-    def test_download_request_exception_exhausted(self, client, mock_session, temp_dir):
-        """Test download fails after exhausting retries on request exceptions."""
-        repo = GitHubRepository(owner="test", repo="repo")
-        pkg = PackageDependency(
-            name="test-pkg",
-            version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/test-pkg@1.0.0",
-            github_repository=repo,
+        assert result is True
+        assert pkg.sbom_file == filename
+        assert pkg.sbom_component_count == 0
+        assert (Path(temp_dir) / filename).exists()
+
+    def test_download_request_exception(self, client, session, http, temp_dir, pkg):
+        """Test request exceptions are recorded as transient failures."""
+        http.add(
+            responses.GET,
+            _SBOM_URL.format(owner="test", repo="repo"),
+            body=requests.ConnectionError("Connection failed"),
         )
 
-        # All calls raise exception
-        mock_session.get.side_effect = requests.RequestException("Connection failed")
-
-        with patch("time.sleep"):
-            result = client.download_dependency_sbom(mock_session, pkg, temp_dir)
+        result = client.download_dependency_sbom(session, pkg, temp_dir)
 
         assert result is False
         assert "Connection failed" in pkg.error
         assert pkg.error_type == ErrorType.TRANSIENT
+
+    def test_download_batch_preserves_order(self, client, session, http, temp_dir):
+        """Test batch download returns one result per package, in input order."""
+        pkgs = [
+            PackageDependency(
+                name=name,
+                version="1.0.0",
+                ecosystem="npm",
+                purl=f"pkg:npm/{name}@1.0.0",
+                github_repository=GitHubRepository(owner="test", repo=name),
+            )
+            for name in ("missing-a", "present", "missing-b")
+        ]
+        for name in ("missing-a", "missing-b"):
+            http.add(responses.GET, _SBOM_URL.format(owner="test", repo=name), status=404)
+        self._add_sbom(http, "test", "present")
+
+        results = client.download_dependency_sboms(session, pkgs, temp_dir, max_workers=3)
+
+        assert results == [False, True, False]
+        assert [pkg.sbom_downloaded for pkg in pkgs] == results
+        assert (Path(temp_dir) / "test_present_main.json").exists()
+
+    def test_download_batch_survives_invalid_body(self, client, session, http, temp_dir):
+        """Test a 200 response with a non-JSON body fails only its own package."""
+        pkgs = [
+            PackageDependency(
+                name=name,
+                version="1.0.0",
+                ecosystem="npm",
+                purl=f"pkg:npm/{name}@1.0.0",
+                github_repository=GitHubRepository(owner="test", repo=name),
+            )
+            for name in ("first", "broken", "last")
+        ]
+        self._add_sbom(http, "test", "first")
+        http.add(
+            responses.GET,
+            _SBOM_URL.format(owner="test", repo="broken"),
+            body="<html>Unicorn!</html>",
+            content_type="text/html",
+        )
+        http.add(
+            responses.GET,
+            _REPO_URL.format(owner="test", repo="broken"),
+            json={"default_branch": "main"},
+        )
+        self._add_sbom(http, "test", "last")
+
+        results = client.download_dependency_sboms(session, pkgs, temp_dir, max_workers=3)
+
+        assert results == [True, False, True]
+        assert pkgs[1].error_type == ErrorType.TRANSIENT
+        assert pkgs[1].error
+        assert not (Path(temp_dir) / "test_broken_main.json").exists()
+        assert (Path(temp_dir) / "test_last_main.json").exists()
+
+    def test_download_batch_isolates_unexpected_errors(self, client, session, temp_dir):
+        """Test an exception in one worker fails only its package and reports each result."""
+        pkgs = [
+            PackageDependency(
+                name=name, version="1.0.0", ecosystem="npm", purl=f"pkg:npm/{name}@1.0.0"
+            )
+            for name in ("first", "boom", "last")
+        ]
+
+        def download(session, pkg, output_dir):
+            if pkg.name == "boom":
+                raise RuntimeError("disk on fire")
+            return True
+
+        completed = []
+        with patch.object(client, "download_dependency_sbom", side_effect=download):
+            results = client.download_dependency_sboms(
+                session, pkgs, temp_dir, on_complete=lambda i, ok: completed.append((i, ok))
+            )
+
+        assert results == [True, False, True]
+        assert pkgs[1].error == "disk on fire"
+        assert pkgs[1].error_type == ErrorType.UNKNOWN
+        assert sorted(completed) == [(0, True), (1, False), (2, True)]
+
+    def test_download_batch_empty(self, client, session, http, temp_dir):
+        """Test batch download of no packages makes no requests."""
+        assert client.download_dependency_sboms(session, [], temp_dir) == []
+        assert len(http.calls) == 0
@@ -1,6 +1,6 @@
 """Comprehensive unit tests for mapper factory - Complete Coverage."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -149,60 +149,50 @@ class TestMapPackageToGitHub:
         """Create mapper factory for testing."""
         return MapperFactory(Config())
 
-    @patch("sbom_fetcher.services.mappers.NPMPackageMapper.map_to_github")
-    def test_map_npm_package_success(self, mock_map, factory):
-        """Test successful mapping of NPM package."""
-        pkg = PackageDependency(
-            name="lodash",
-            version="4.17.21",
-            ecosystem="npm",
-            purl="pkg:npm/lodash@4.17.21",
-        )
-
-        repo = GitHubRepository(owner="lodash", repo="lodash")
-        mock_map.return_value = repo
-
-        result = factory.map_package_to_github(pkg)
-
-        assert result is True
-        assert pkg.github_repository == repo
-        mock_map.assert_called_once_with("lodash")
-
-    @patch("sbom_fetcher.services.mappers.PyPIPackageMapper.map_to_github")
-    def test_map_pypi_package_success(self, mock_map, factory):
-        """Test successful mapping of PyPI package."""
-        pkg = PackageDependency(
-            name="requests",
-            version="2.28.0",
-            ecosystem="pypi",
-            purl="pkg:pypi/requests@2.28.0",
-        )
-
-        repo = GitHubRepository(owner="psf", repo="requests")
-        mock_map.return_value = repo
-
-        result = factory.map_package_to_github(pkg)
-
-        assert result is True
-        assert pkg.github_repository == repo
-        mock_map.assert_called_once_with("requests")
-
-    @patch("sbom_fetcher.services.mappers.NPMPackageMapper.map_to_github")
-    def test_map_package_failure_returns_none(self, mock_map, factory):
-        """Test mapping failure when repository not found."""
+    @pytest.mark.parametrize(
+        "ecosystem,name,mapper_cls,mapped_repo",
+        [
+            pytest.param(
+                "npm", "lodash", NPMPackageMapper, GitHubRepository("lodash", "lodash"), id="npm"
+            ),
+            pytest.param(
+                "pypi",
+                "requests",
+                PyPIPackageMapper,
+                GitHubRepository("psf", "requests"),
+                id="pypi",
+            ),
+            pytest.param(
+                "NPM",
+                "express",
+                NPMPackageMapper,
+                GitHubRepository("expressjs", "express"),
+                id="uppercase-ecosystem",
+            ),
+            pytest.param(
+                "npm",
+                "@babel/core",
+                NPMPackageMapper,
+                GitHubRepository("babel", "babel"),
+                id="scoped-npm",
+            ),
+            pytest.param("npm", "nonexistent", NPMPackageMapper, None, id="not-found"),
+        ],
+    )
+    def test_map_package_to_github(self, factory, ecosystem, name, mapper_cls, mapped_repo):
+        """Test the factory routes each ecosystem to its mapper and records the result."""
         pkg = PackageDependency(
-            name="nonexistent",
+            name=name,
             version="1.0.0",
-            ecosystem="npm",
-            purl="pkg:npm/nonexistent@1.0.0",
+            ecosystem=ecosystem,
+            purl=f"pkg:{ecosystem.lower()}/{name}@1.0.0",
         )
 
-        mock_map.return_value = None
+        with patch.object(mapper_cls, "map_to_github", return_value=mapped_repo) as mock_map:
+            result = factory.map_package_to_github(pkg)
 
-        result = factory.map_package_to_github(pkg)
-
-        assert result is False
-        assert pkg.github_repository is None
+        assert (result, pkg.github_repository) == (mapped_repo is not None, mapped_repo)
+        mock_map.assert_called_once_with(name)
 
     def test_map_unsupported_ecosystem(self, factory):
         """Test mapping package from unsupported ecosystem."""
@@ -218,43 +208,6 @@ class TestMapPackageToGitHub:
         assert result is False
         assert pkg.github_repository is None
 
-    @patch("sbom_fetcher.services.mappers.NPMPackageMapper.map_to_github")
-    def test_map_package_uppercase_ecosystem(self, mock_map, factory):
-        """Test mapping with uppercase ecosystem name."""
-        pkg = PackageDependency(
-            name="express",
-            version="4.18.0",
-            ecosystem="NPM",
-            purl="pkg:npm/express@4.18.0",
-        )
-
-        repo = GitHubRepository(owner="expressjs", repo="express")
-        mock_map.return_value = repo
-
-        result = factory.map_package_to_github(pkg)
-
-        assert result is True
-        assert pkg.github_repository == repo
-
-    @patch("sbom_fetcher.services.mappers.NPMPackageMapper.map_to_github")
-    def test_map_scoped_npm_package(self, mock_map, factory):
-        """Test mapping scoped NPM package."""
-        pkg = PackageDependency(
-            name="@babel/core",
-            version="7.22.0",
-            ecosystem="npm",
-            purl="pkg:npm/%40babel/core@7.22.0",
-        )
-
-        repo = GitHubRepository(owner="babel", repo="babel")
-        mock_map.return_value = repo
-
-        result = factory.map_package_to_github(pkg)
-
-        assert result is True
-        assert pkg.github_repository == repo
-        mock_map.assert_called_once_with("@babel/core")
-
     def test_map_package_updates_package_object(self, factory):
         """Test that successful mapping updates the package object."""
         pkg = PackageDependency(
@@ -5,7 +5,6 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from sbom_fetcher.domain.models import GitHubRepository
 from sbom_fetcher.infrastructure.config import Config
 from sbom_fetcher.services.mappers import (
     GitHubActionsMapper,
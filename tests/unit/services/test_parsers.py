@@ -3,10 +3,28 @@
 import pytest
 
 from sbom_fetcher.domain.exceptions import ValidationError
-from sbom_fetcher.domain.models import PackageDependency
 from sbom_fetcher.services.parsers import PURLParser, SBOMParser
 
 
+def _spdx_package(name, version, purl="", spdx_id=None):
+    """Build an SPDX package entry, with a purl external reference when given."""
+    return {
+        "SPDXID": f"SPDXRef-Package-{spdx_id or name}",
+        "name": name,
+        "versionInfo": version,
+        "externalRefs": [{"referenceType": "purl", "referenceLocator": purl}] if purl else [],
+    }
+
+
+def _spdx_sbom(*packages):
+    """Wrap package entries in a minimal SPDX document."""
+    return {"spdxVersion": "SPDX-2.3", "packages": list(packages)}
+
+
+# Read-only; tests that need to modify a package build their own
+_LODASH = _spdx_package("lodash", "4.17.21", "pkg:npm/lodash@4.17.21")
+
+
 class TestPURLParserComprehensive:
     """Comprehensive tests for PURL parser."""
 
@@ -141,34 +159,12 @@ class TestSBOMParserComprehensive:
     @pytest.fixture
     def valid_sbom(self):
         """Valid SBOM data fixture in pure SPDX format."""
-        return {
-            "spdxVersion": "SPDX-2.3",
-            "SPDXID": "SPDXRef-DOCUMENT",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-lodash",
-                    "name": "lodash",
-                    "versionInfo": "4.17.21",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        }
-                    ],
-                },
-                {
-                    "SPDXID": "SPDXRef-Package-requests",
-                    "name": "requests",
-                    "versionInfo": "2.31.0",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:pypi/requests@2.31.0",
-                        }
-                    ],
-                },
-            ],
-        }
+        sbom = _spdx_sbom(
+            _spdx_package("lodash", "4.17.21", "pkg:npm/lodash@4.17.21"),
+            _spdx_package("requests", "2.31.0", "pkg:pypi/requests@2.31.0"),
+        )
+        sbom["SPDXID"] = "SPDXRef-DOCUMENT"
+        return sbom
 
     def test_extract_packages_from_valid_sbom(self, parser, valid_sbom):
         """Test extracting packages from valid SBOM."""
@@ -185,17 +181,7 @@ class TestSBOMParserComprehensive:
     def test_extract_packages_filters_root(self, parser, valid_sbom):
         """Test that root repository package is filtered out."""
         valid_sbom["packages"].append(
-            {
-                "SPDXID": "SPDXRef-Package-root",
-                "name": "my-repo",
-                "versionInfo": "1.0.0",
-                "externalRefs": [
-                    {
-                        "referenceType": "purl",
-                        "referenceLocator": "pkg:github/owner/my-repo@1.0.0",
-                    }
-                ],
-            }
+            _spdx_package("my-repo", "1.0.0", "pkg:github/owner/my-repo@1.0.0", spdx_id="root")
         )
 
         packages = parser.extract_packages(valid_sbom, owner="owner", repo="my-repo")
@@ -206,33 +192,9 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_skips_document_spdx(self, parser):
         """Test that SPDXRef-DOCUMENT is skipped."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-DOCUMENT",
-                    "name": "document",
-                    "versionInfo": "1.0.0",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/document@1.0.0",
-                        }
-                    ],
-                },
-                {
-                    "SPDXID": "SPDXRef-Package-lodash",
-                    "name": "lodash",
-                    "versionInfo": "4.17.21",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        }
-                    ],
-                },
-            ],
-        }
+        document = _spdx_package("document", "1.0.0", "pkg:npm/document@1.0.0")
+        document["SPDXID"] = "SPDXRef-DOCUMENT"
+        sbom = _spdx_sbom(document, _LODASH)
 
         packages = parser.extract_packages(sbom)
 
@@ -241,28 +203,7 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_skips_without_purl(self, parser):
         """Test that packages without PURL are skipped."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-nopurl",
-                    "name": "no-purl",
-                    "versionInfo": "1.0.0",
-                    "externalRefs": [],
-                },
-                {
-                    "SPDXID": "SPDXRef-Package-lodash",
-                    "name": "lodash",
-                    "versionInfo": "4.17.21",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        }
-                    ],
-                },
-            ],
-        }
+        sbom = _spdx_sbom(_spdx_package("no-purl", "1.0.0"), _LODASH)
 
         packages = parser.extract_packages(sbom)
 
@@ -271,9 +212,7 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_handles_empty_sbom(self, parser):
         """Test handling empty SBOM."""
-        sbom = {"spdxVersion": "SPDX-2.3", "packages": []}
-
-        packages = parser.extract_packages(sbom)
+        packages = parser.extract_packages(_spdx_sbom())
 
         assert len(packages) == 0
 
@@ -310,22 +249,7 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_uses_parsed_name_when_missing(self, parser):
         """Test that parser fills in name from PURL if missing."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-noname",
-                    "name": "",
-                    "versionInfo": "",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        }
-                    ],
-                }
-            ],
-        }
+        sbom = _spdx_sbom(_spdx_package("", "", "pkg:npm/lodash@4.17.21", spdx_id="noname"))
 
         packages = parser.extract_packages(sbom)
 
@@ -335,22 +259,7 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_uses_parsed_version_when_missing(self, parser):
         """Test that parser fills in version from PURL if missing."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-lodash",
-                    "name": "lodash",
-                    "versionInfo": "",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        }
-                    ],
-                }
-            ],
-        }
+        sbom = _spdx_sbom(_spdx_package("lodash", "", "pkg:npm/lodash@4.17.21"))
 
         packages = parser.extract_packages(sbom)
 
@@ -359,47 +268,21 @@ class TestSBOMParserComprehensive:
 
     def test_extract_packages_handles_multiple_external_refs(self, parser):
         """Test handling package with multiple external references."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-lodash",
-                    "name": "lodash",
-                    "versionInfo": "4.17.21",
-                    "externalRefs": [
-                        {"referenceType": "homepage", "referenceLocator": "https://lodash.com"},
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/lodash@4.17.21",
-                        },
-                    ],
-                }
-            ],
-        }
+        lodash = _spdx_package("lodash", "4.17.21", "pkg:npm/lodash@4.17.21")
+        lodash["externalRefs"].insert(
+            0, {"referenceType": "homepage", "referenceLocator": "https://lodash.com"}
+        )
 
-        packages = parser.extract_packages(sbom)
+        packages = parser.extract_packages(_spdx_sbom(lodash))
 
         assert len(packages) == 1
         assert packages[0].purl == "pkg:npm/lodash@4.17.21"
 
     def test_extract_packages_scoped_npm(self, parser):
         """Test extracting scoped npm package."""
-        sbom = {
-            "spdxVersion": "SPDX-2.3",
-            "packages": [
-                {
-                    "SPDXID": "SPDXRef-Package-babel",
-                    "name": "@babel/core",
-                    "versionInfo": "7.22.0",
-                    "externalRefs": [
-                        {
-                            "referenceType": "purl",
-                            "referenceLocator": "pkg:npm/%40babel/core@7.22.0",
-                        }
-                    ],
-                }
-            ],
-        }
+        sbom = _spdx_sbom(
+            _spdx_package("@babel/core", "7.22.0", "pkg:npm/%40babel/core@7.22.0", spdx_id="babel")
+        )
 
         packages = parser.extract_packages(sbom)
 
@@ -7,6 +7,16 @@ import pytest
 from sbom_fetcher.infrastructure.config import Config
 from sbom_fetcher.services.mappers import PyPIPackageMapper
 
+GITHUB_URL_VARIANTS = [
+    "https://github.com/owner/repo",
+    "https://github.com/owner/repo.git",
+    "https://github.com/owner/repo/",
+    "http://github.com/owner/repo",
+    "https://www.github.com/owner/repo",
+    "git+https://github.com/owner/repo.git",
+    "https://github.com/owner/repo/tree/main",
+]
+
 
 class TestPyPIMapperImprovements:
     """Test improved PyPI mapper with flexible key matching."""
@@ -169,24 +179,16 @@ class TestPyPIMapperImprovements:
         assert result.owner == "test"
         assert result.repo == "homepage"
 
+    @pytest.mark.parametrize("url", GITHUB_URL_VARIANTS)
     @patch("sbom_fetcher.services.mappers.requests.get")
-    def test_handles_github_url_variations(self, mock_get, mapper):
+    def test_handles_github_url_variations(self, mock_get, mapper, url):
         """Test handling of various GitHub URL formats."""
-        test_cases = [
-            "https://github.com/owner/repo",
-            "https://github.com/owner/repo.git",
-            "https://github.com/owner/repo/",
-            "http://github.com/owner/repo",
-        ]
-
-        for url in test_cases:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"info": {"project_urls": {"Source": url}}}
-            mock_get.return_value = mock_response
-
-            result = mapper.map_to_github("test")
-
-            assert result is not None, f"Failed to parse: {url}"
-            assert result.owner == "owner"
-            assert result.repo == "repo"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"info": {"project_urls": {"Source": url}}}
+        mock_get.return_value = mock_response
+
+        result = mapper.map_to_github("test")
+
+        assert result is not None, f"Failed to parse: {url}"
+        assert (result.owner, result.repo) == ("owner", "repo")
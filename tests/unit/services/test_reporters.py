@@ -1,6 +1,6 @@
 """Comprehensive unit tests for reporters - 100% Coverage."""
 
-import tempfile
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -13,7 +13,42 @@ from sbom_fetcher.domain.models import (
     FetcherStats,
     PackageDependency,
 )
-from sbom_fetcher.services.reporters import MarkdownReporter
+from sbom_fetcher.services.reporters import MarkdownReporter, group_failures_by_type
+
+_PERMANENT_FAILURE = FailureInfo(
+    repository="owner/repo1",
+    package_name="pkg1",
+    ecosystem="npm",
+    versions=["1.0.0", "1.0.1"],
+    error="Dependency graph not enabled",
+    error_type=ErrorType.PERMANENT,
+)
+_TRANSIENT_FAILURE = FailureInfo(
+    repository="owner/repo2",
+    package_name="pkg2",
+    ecosystem="pypi",
+    versions=["2.0.0"],
+    error="Timeout",
+    error_type=ErrorType.TRANSIENT,
+)
+
+
+class TestGroupFailuresByType:
+    """Tests for grouping failures by error type."""
+
+    def test_groups_preserve_input_order(self):
+        """Test each group keeps the original relative order."""
+        second_permanent = replace(_PERMANENT_FAILURE, repository="owner/repo3")
+        failures = [_TRANSIENT_FAILURE, _PERMANENT_FAILURE, second_permanent]
+
+        assert group_failures_by_type(failures) == {
+            ErrorType.PERMANENT: [_PERMANENT_FAILURE, second_permanent],
+            ErrorType.TRANSIENT: [_TRANSIENT_FAILURE],
+        }
+
+    def test_empty(self):
+        """Test no failures yields no groups."""
+        assert group_failures_by_type([]) == {}
 
 
 class TestMarkdownReporter:
@@ -25,10 +60,9 @@ class TestMarkdownReporter:
         return MarkdownReporter()
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def temp_dir(self, fs):
+        """Create an output directory on an in-memory filesystem."""
+        return Path(fs.create_dir("/out").path)
 
     @pytest.fixture
     def basic_stats(self):
@@ -87,7 +121,7 @@ class TestMarkdownReporter:
 
     def test_report_contains_statistics(self, reporter, temp_dir, basic_stats, sample_packages):
         """Test report contains all statistics."""
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -97,8 +131,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "**Root SBOM dependency repositories:** 10" in content
         assert "**Mapped to GitHub repos:** 8" in content
         assert "**Unique repositories:** 6" in content
@@ -108,90 +140,47 @@ class TestMarkdownReporter:
         assert "**SBOMs failed (permanent):** 🔴 **1**" in content
         assert "**SBOMs failed (transient):** ⚠️ **1**" in content
 
-    def test_report_with_permanent_failures(self, reporter, temp_dir, basic_stats):
-        """Test report with permanent failure information."""
-        failures = [
-            FailureInfo(
-                repository="owner/repo1",
-                package_name="pkg1",
-                ecosystem="npm",
-                versions=["1.0.0", "1.0.1"],
-                error="Dependency graph not enabled",
-                error_type=ErrorType.PERMANENT,
-            )
-        ]
-
-        filename = reporter.generate(
-            output_dir=temp_dir,
-            owner="owner",
-            repo="repo",
-            stats=basic_stats,
-            packages=[],
-            version_mapping={},
-            failed_sboms=failures,
-            unmapped_packages=[],
-        )
-
-        content = (temp_dir / filename).read_text()
-        assert "## Failed SBOM Downloads" in content
-        assert "### 🔴 Permanent Failures" in content
-        assert "owner/repo1" in content
-        assert "**Package:** pkg1" in content
-        assert "**Ecosystem:** npm" in content
-        assert "**Versions:** 1.0.0, 1.0.1" in content
-        assert "Dependency graph not enabled" in content
-
-    def test_report_with_transient_failures(self, reporter, temp_dir, basic_stats):
-        """Test report with transient failure information."""
-        failures = [
-            FailureInfo(
-                repository="owner/repo2",
-                package_name="pkg2",
-                ecosystem="pypi",
-                versions=["2.0.0"],
-                error="Timeout",
-                error_type=ErrorType.TRANSIENT,
-            )
-        ]
-
-        filename = reporter.generate(
-            output_dir=temp_dir,
-            owner="owner",
-            repo="repo",
-            stats=basic_stats,
-            packages=[],
-            version_mapping={},
-            failed_sboms=failures,
-            unmapped_packages=[],
-        )
-
-        content = (temp_dir / filename).read_text()
-        assert "### ⚠️ Transient Failures" in content
-        assert "owner/repo2" in content
-        assert "**Error:** `Timeout`" in content
-
-    def test_report_with_mixed_failures(self, reporter, temp_dir, basic_stats):
-        """Test report with both permanent and transient failures."""
-        failures = [
-            FailureInfo(
-                repository="owner/perm",
-                package_name="perm-pkg",
-                ecosystem="npm",
-                versions=["1.0.0"],
-                error="Permanent error",
-                error_type=ErrorType.PERMANENT,
+    @pytest.mark.parametrize(
+        "failures,expected,absent",
+        [
+            pytest.param(
+                [_PERMANENT_FAILURE],
+                [
+                    "## Failed SBOM Downloads",
+                    "### 🔴 Permanent Failures",
+                    "owner/repo1",
+                    "**Package:** pkg1",
+                    "**Ecosystem:** npm",
+                    "**Versions:** 1.0.0, 1.0.1",
+                    "Dependency graph not enabled",
+                ],
+                ["### ⚠️ Transient Failures"],
+                id="permanent",
             ),
-            FailureInfo(
-                repository="owner/trans",
-                package_name="trans-pkg",
-                ecosystem="pypi",
-                versions=["2.0.0"],
-                error="Transient error",
-                error_type=ErrorType.TRANSIENT,
+            pytest.param(
+                [_TRANSIENT_FAILURE],
+                ["### ⚠️ Transient Failures", "owner/repo2", "**Error:** `Timeout`"],
+                ["### 🔴 Permanent Failures"],
+                id="transient",
             ),
-        ]
-
-        filename = reporter.generate(
+            pytest.param(
+                [_PERMANENT_FAILURE, _TRANSIENT_FAILURE],
+                [
+                    "**Total failures:** 2 (1 permanent, 1 transient)",
+                    "### 🔴 Permanent Failures",
+                    "### ⚠️ Transient Failures",
+                ],
+                [],
+                id="mixed",
+            ),
+            pytest.param([], [], ["## Failed SBOM Downloads"], id="none"),
+        ],
+    )
+    def test_report_failure_sections(
+        self, reporter, temp_dir, basic_stats, failures, expected, absent
+    ):
+        """Test failure sections are rendered for each mix of failure types."""
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -201,11 +190,8 @@ class TestMarkdownReporter:
             failed_sboms=failures,
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
-        assert "**Total failures:** 2 (1 permanent, 1 transient)" in content
-        assert "### 🔴 Permanent Failures" in content
-        assert "### ⚠️ Transient Failures" in content
+        assert [text for text in expected if text not in content] == []
+        assert [text for text in absent if text in content] == []
 
     def test_report_with_multiple_versions(self, reporter, temp_dir, basic_stats):
         """Test report with repositories using multiple versions."""
@@ -224,7 +210,7 @@ class TestMarkdownReporter:
             },
         }
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -234,8 +220,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "## Repositories with Multiple Versions" in content
         assert "**Total:** 2 repositories" in content
         assert "owner/repo1" in content
@@ -254,7 +238,7 @@ class TestMarkdownReporter:
                 "sbom_file": f"owner_repo{i}_main.json",
             }
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -264,8 +248,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "**Total:** 15 repositories" in content
         assert "... and 5 more repositories" in content
 
@@ -273,7 +255,7 @@ class TestMarkdownReporter:
         """Test report with packages that couldn't be mapped."""
         unmapped = [sample_packages[0]]  # lodash
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -283,8 +265,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=unmapped,
         )
-
-        content = (temp_dir / filename).read_text()
         assert "## Packages That Could Not Be Mapped to GitHub" in content
         assert "**Total:** 1 packages" in content
         assert "lodash (v4.17.21)" in content
@@ -298,7 +278,7 @@ class TestMarkdownReporter:
             mock_dt.now.return_value = datetime(2024, 1, 1, 12, 0, 0)
             mock_dt.strftime = datetime.strftime
 
-            filename = reporter.generate(
+            content = reporter.render(
                 output_dir=temp_dir,
                 owner="owner",
                 repo="repo",
@@ -308,14 +288,12 @@ class TestMarkdownReporter:
                 failed_sboms=[],
                 unmapped_packages=[],
             )
-
-            content = (temp_dir / filename).read_text()
             assert "**Execution Date:** 2024-01-01 12:00:00" in content
             assert f"**Output Directory:** `{temp_dir}`" in content
 
     def test_report_includes_deduplication_stats(self, reporter, temp_dir, basic_stats):
         """Test report includes deduplication statistics."""
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -325,8 +303,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "### Deduplication Impact" in content
         assert "**Packages mapped:** 8" in content
         assert "**Unique repositories:** 6" in content
@@ -334,7 +310,7 @@ class TestMarkdownReporter:
 
     def test_report_includes_files_generated(self, reporter, temp_dir, basic_stats):
         """Test report lists generated files."""
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="myowner",
             repo="myrepo",
@@ -344,8 +320,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "## Files Generated" in content
         assert "`myowner_myrepo_root.json`" in content
         assert "`version_mapping.json`" in content
@@ -354,7 +328,7 @@ class TestMarkdownReporter:
 
     def test_report_includes_footer(self, reporter, temp_dir, basic_stats):
         """Test report includes footer."""
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -364,8 +338,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "Generated by GitHub SBOM API Fetcher" in content
         assert "For more information, see README.md" in content
 
@@ -386,7 +358,7 @@ class TestMarkdownReporter:
             },
         }
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -396,8 +368,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         # repo2 should appear first (3 versions > 2 versions)
         repo2_pos = content.find("owner/repo2")
         repo1_pos = content.find("owner/repo1")
@@ -408,7 +378,7 @@ class TestMarkdownReporter:
         stats = FetcherStats()
         stats.unique_repos = 0
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -418,8 +388,6 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
         assert "### Deduplication Impact" in content
 
     def test_report_elapsed_time_formatted(self, reporter, temp_dir):
@@ -427,10 +395,9 @@ class TestMarkdownReporter:
         import time
 
         stats = FetcherStats()
-        stats.start_time = time.time()
-        stats.end_time = stats.start_time + 330  # 5 min 30 sec
+        stats.start_time = time.monotonic() - 330  # 5 min 30 sec
 
-        filename = reporter.generate(
+        content = reporter.render(
             output_dir=temp_dir,
             owner="owner",
             repo="repo",
@@ -440,6 +407,4 @@ class TestMarkdownReporter:
             failed_sboms=[],
             unmapped_packages=[],
         )
-
-        content = (temp_dir / filename).read_text()
-        assert "**Elapsed time:**" in content
+        assert "**Elapsed time:** 5m 30s" in content
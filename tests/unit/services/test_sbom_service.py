@@ -1,9 +1,7 @@
 """Comprehensive unit tests for SBOM fetcher service - Complete Coverage."""
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -14,9 +12,73 @@ from sbom_fetcher.domain.models import (
     PackageDependency,
 )
 from sbom_fetcher.infrastructure.config import Config
+from sbom_fetcher.infrastructure.serialization import dumps_json
 from sbom_fetcher.services.sbom_service import SBOMFetcherService, save_root_sbom
 
 
+def _batch_github_client():
+    """Mock GitHub client whose batch download delegates to the per-package mock."""
+    github_client = Mock()
+
+    def download_all(session, pkgs, out, on_complete=None):
+        results = []
+        for i, pkg in enumerate(pkgs):
+            results.append(github_client.download_dependency_sbom(session, pkg, out))
+            if on_complete is not None:
+                on_complete(i, results[-1])
+        return results
+
+    github_client.download_dependency_sboms.side_effect = download_all
+    return github_client
+
+
+def _npm_packages(count):
+    """Build ``count`` distinct unmapped npm packages."""
+    return [
+        PackageDependency(
+            name=f"pkg{i}", version="1.0.0", ecosystem="npm", purl=f"pkg:npm/pkg{i}@1.0.0"
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record rate-limit pauses instead of sleeping."""
+    pauses = []
+    monkeypatch.setattr("sbom_fetcher.services.sbom_service.time.sleep", pauses.append)
+    return pauses
+
+
+@pytest.fixture
+def mock_dependencies(tmp_path):
+    """Create all mocked dependencies."""
+    github_client = _batch_github_client()
+    mapper_factory = Mock()
+    repository = Mock()
+    reporter = Mock()
+    config = Config(output_dir=tmp_path)
+    return {
+        "github_client": github_client,
+        "mapper_factory": mapper_factory,
+        "repository": repository,
+        "reporter": reporter,
+        "config": config,
+    }
+
+
+@pytest.fixture
+def service(mock_dependencies):
+    """Create service with mocked dependencies."""
+    return SBOMFetcherService(**mock_dependencies)
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock requests session."""
+    return Mock()
+
+
 class TestSBOMFetcherServiceInitialization:
     """Tests for service initialization."""
 
@@ -47,38 +109,6 @@ class TestSBOMFetcherServiceInitialization:
 class TestFetchAllSBOMs:
     """Comprehensive tests for main workflow."""
 
-    @pytest.fixture
-    def mock_dependencies(self):
-        """Create all mocked dependencies."""
-        github_client = Mock()
-        mapper_factory = Mock()
-        repository = Mock()
-        reporter = Mock()
-        config = Config()
-        return {
-            "github_client": github_client,
-            "mapper_factory": mapper_factory,
-            "repository": repository,
-            "reporter": reporter,
-            "config": config,
-        }
-
-    @pytest.fixture
-    def service(self, mock_dependencies):
-        """Create service with mocked dependencies."""
-        return SBOMFetcherService(**mock_dependencies)
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock requests session."""
-        return Mock()
-
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
     def test_fetch_all_sboms_root_fetch_failure(self, service, mock_session, mock_dependencies):
         """Test handling of root SBOM fetch failure."""
         mock_dependencies["github_client"].fetch_root_sbom.return_value = None
@@ -90,32 +120,19 @@ class TestFetchAllSBOMs:
         assert len(result.failed_downloads) == 0
         assert result.stats.packages_in_sbom == 0
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    def test_fetch_all_sboms_no_packages_found(
-        self, mock_path, mock_save, service, mock_session, mock_dependencies
-    ):
+    def test_fetch_all_sboms_no_packages_found(self, service, mock_session, mock_dependencies):
         """Test handling when no packages found in SBOM."""
         # Setup mocks
         mock_dependencies["github_client"].fetch_root_sbom.return_value = {"sbom": {"packages": []}}
 
-        # Mock Path operations
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-
         with patch.object(service._parser, "extract_packages", return_value=[]):
             result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert len(result.packages) == 0
         assert result.stats.packages_in_sbom == 0
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    @patch("sbom_fetcher.services.sbom_service.time.sleep")
     def test_fetch_all_sboms_successful_workflow(
-        self, mock_sleep, mock_path, mock_save, service, mock_session, mock_dependencies
+        self, service, mock_session, mock_dependencies, tmp_path
     ):
         """Test complete successful workflow."""
         # Setup root SBOM
@@ -138,13 +155,6 @@ class TestFetchAllSBOMs:
             github_repository=GitHubRepository(owner="psf", repo="requests"),
         )
 
-        # Mock Path operations
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-        mock_output_dir.__str__ = Mock(return_value="/tmp/test")
-
         # Mock parser
         with patch.object(service._parser, "extract_packages", return_value=[pkg1, pkg2]):
             # Mock mapper
@@ -157,20 +167,16 @@ class TestFetchAllSBOMs:
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
             # Mock json.dump for version_mapping
-            with patch("builtins.open", mock_open()):
-                with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                    result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert result.stats.packages_in_sbom == 2
         assert result.stats.github_repos_mapped == 2
         assert result.stats.unique_repos == 2
         assert result.stats.sboms_downloaded == 2
+        (mapping_file,) = tmp_path.glob("sbom_export_*/owner_repo/version_mapping.json")
+        assert set(json.loads(mapping_file.read_text())) == {"lodash/lodash", "psf/requests"}
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    def test_fetch_all_sboms_with_unmapped_packages(
-        self, mock_path, mock_save, service, mock_session, mock_dependencies
-    ):
+    def test_fetch_all_sboms_with_unmapped_packages(self, service, mock_session, mock_dependencies):
         """Test workflow with packages that can't be mapped."""
         root_sbom = {"sbom": {"packages": [{"name": "test"}]}}
         mock_dependencies["github_client"].fetch_root_sbom.return_value = root_sbom
@@ -182,30 +188,18 @@ class TestFetchAllSBOMs:
             purl="pkg:npm/unmapped@1.0.0",
         )
 
-        # Mock Path
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-        mock_output_dir.__str__ = Mock(return_value="/tmp/test")
-
         with patch.object(service._parser, "extract_packages", return_value=[pkg]):
             mock_dependencies["mapper_factory"].map_package_to_github.return_value = False
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
-            with patch("builtins.open", mock_open()):
-                with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                    result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert result.stats.packages_without_github == 1
         assert len(result.unmapped_packages) == 1
+        # Unmapped packages are never queued for download
+        mock_dependencies["github_client"].download_dependency_sbom.assert_not_called()
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    @patch("sbom_fetcher.services.sbom_service.time.sleep")
-    def test_fetch_all_sboms_with_failed_downloads(
-        self, mock_sleep, mock_path, mock_save, service, mock_session, mock_dependencies
-    ):
+    def test_fetch_all_sboms_with_failed_downloads(self, service, mock_session, mock_dependencies):
         """Test workflow with failed SBOM downloads."""
         root_sbom = {"sbom": {"packages": [{"name": "test"}]}}
         mock_dependencies["github_client"].fetch_root_sbom.return_value = root_sbom
@@ -218,13 +212,6 @@ class TestFetchAllSBOMs:
             github_repository=GitHubRepository(owner="test", repo="failing"),
         )
 
-        # Mock Path
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-        mock_output_dir.__str__ = Mock(return_value="/tmp/test")
-
         with patch.object(service._parser, "extract_packages", return_value=[pkg]):
             mock_dependencies["mapper_factory"].map_package_to_github.return_value = True
             mock_dependencies["github_client"].download_dependency_sbom.return_value = False
@@ -235,20 +222,13 @@ class TestFetchAllSBOMs:
 
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
-            with patch("builtins.open", mock_open()):
-                with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                    result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert result.stats.sboms_failed_permanent == 1
         assert len(result.failed_downloads) == 1
         assert result.failed_downloads[0].error == "Dependency graph not enabled"
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    @patch("sbom_fetcher.services.sbom_service.time.sleep")
-    def test_fetch_all_sboms_with_deduplication(
-        self, mock_sleep, mock_path, mock_save, service, mock_session, mock_dependencies
-    ):
+    def test_fetch_all_sboms_with_deduplication(self, service, mock_session, mock_dependencies):
         """Test workflow handles duplicate repositories."""
         root_sbom = {"sbom": {"packages": [{"name": "test"}]}}
         mock_dependencies["github_client"].fetch_root_sbom.return_value = root_sbom
@@ -269,33 +249,32 @@ class TestFetchAllSBOMs:
             github_repository=GitHubRepository(owner="lodash", repo="lodash"),
         )
 
-        # Mock Path
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-        mock_output_dir.__str__ = Mock(return_value="/tmp/test")
+        def download(session, dep, output_dir):
+            dep.sbom_downloaded = True
+            dep.sbom_file = "lodash_lodash_main.json"
+            dep.sbom_component_count = 3
+            return True
 
         with patch.object(service._parser, "extract_packages", return_value=[pkg1, pkg2]):
             mock_dependencies["mapper_factory"].map_package_to_github.return_value = True
-            mock_dependencies["github_client"].download_dependency_sbom.return_value = True
+            mock_dependencies["github_client"].download_dependency_sbom.side_effect = download
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
-            with patch("builtins.open", mock_open()):
-                with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                    result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         # Should have 1 unique repo, 1 duplicate skipped
         assert result.stats.unique_repos == 1
         assert result.stats.duplicates_skipped == 1
-        # Should only download once
+        # Should only download once, and the duplicate shares the result
         assert result.stats.sboms_downloaded == 1
+        mock_dependencies["github_client"].download_dependency_sbom.assert_called_once()
+        assert (pkg2.sbom_downloaded, pkg2.sbom_file, pkg2.sbom_component_count) == (
+            True,
+            "lodash_lodash_main.json",
+            3,
+        )
 
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.Path")
-    def test_fetch_all_sboms_transient_error(
-        self, mock_path, mock_save, service, mock_session, mock_dependencies
-    ):
+    def test_fetch_all_sboms_transient_error(self, service, mock_session, mock_dependencies):
         """Test workflow with transient error handling."""
         root_sbom = {"sbom": {"packages": [{"name": "test"}]}}
         mock_dependencies["github_client"].fetch_root_sbom.return_value = root_sbom
@@ -308,13 +287,6 @@ class TestFetchAllSBOMs:
             github_repository=GitHubRepository(owner="test", repo="timeout"),
         )
 
-        # Mock Path
-        mock_output_dir = Mock()
-        mock_output_dir.mkdir = Mock()
-        mock_path.return_value = mock_output_dir
-        mock_output_dir.__truediv__ = Mock(return_value=mock_output_dir)
-        mock_output_dir.__str__ = Mock(return_value="/tmp/test")
-
         with patch.object(service._parser, "extract_packages", return_value=[pkg]):
             mock_dependencies["mapper_factory"].map_package_to_github.return_value = True
             mock_dependencies["github_client"].download_dependency_sbom.return_value = False
@@ -324,13 +296,55 @@ class TestFetchAllSBOMs:
 
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
-            with patch("builtins.open", mock_open()):
-                with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                    result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert result.stats.sboms_failed_transient == 1
         assert result.failed_downloads[0].error_type == ErrorType.TRANSIENT
 
+    def test_fetch_all_sboms_logs_progress_as_downloads_finish(
+        self, service, mock_session, mock_dependencies, caplog
+    ):
+        """Test progress lines follow completion order, not repository order."""
+        mock_dependencies["github_client"].fetch_root_sbom.return_value = {"packages": []}
+        pkgs = [
+            PackageDependency(
+                name=name,
+                version="1.0.0",
+                ecosystem="npm",
+                purl=f"pkg:npm/{name}@1.0.0",
+                github_repository=GitHubRepository(owner="test", repo=name),
+            )
+            for name in ("slow", "fast")
+        ]
+
+        def download_all(session, download_pkgs, out, on_complete=None):
+            on_complete(1, False)
+            on_complete(0, False)
+            return [False, False]
+
+        mock_dependencies["github_client"].download_dependency_sboms.side_effect = download_all
+        with patch.object(service._parser, "extract_packages", return_value=pkgs):
+            mock_dependencies["mapper_factory"].map_package_to_github.return_value = True
+            with caplog.at_level("INFO", logger="sbom_fetcher.services.sbom_service"):
+                service.fetch_all_sboms("owner", "repo", mock_session)
+
+        progress = [r.getMessage() for r in caplog.records if "] SBOM for" in r.getMessage()]
+        assert progress == [
+            "[1/2] SBOM for test/fast (versions: 1.0.0)",
+            "[2/2] SBOM for test/slow (versions: 1.0.0)",
+        ]
+
+    def test_fetch_all_sboms_pauses_between_registry_batches(
+        self, service, mock_session, mock_dependencies, no_sleep
+    ):
+        """Test mapping pauses after every ten registry lookups."""
+        mock_dependencies["github_client"].fetch_root_sbom.return_value = {"packages": []}
+        with patch.object(service._parser, "extract_packages", return_value=_npm_packages(25)):
+            mock_dependencies["mapper_factory"].map_package_to_github.return_value = False
+            service.fetch_all_sboms("owner", "repo", mock_session)
+
+        assert no_sleep == [0.5, 0.5]
+
 
 class TestSaveRootSBOM:
     """Tests for save_root_sbom helper function."""
@@ -343,11 +357,7 @@ class TestSaveRootSBOM:
         save_root_sbom(sbom_data, output_dir, "owner", "repo")
 
         expected_file = tmp_path / "owner_repo_root.json"
-        assert expected_file.exists()
-
-        with open(expected_file, encoding="utf-8") as f:
-            loaded_data = json.load(f)
-            assert loaded_data == sbom_data
+        assert expected_file.read_bytes() == dumps_json(sbom_data)
 
     def test_save_root_sbom_filename_format(self, tmp_path):
         """Test correct filename format."""
@@ -362,38 +372,10 @@ class TestSaveRootSBOM:
 class TestBranchNameSanitization:
     """Tests for branch name sanitization in component counting."""
 
-    @pytest.fixture
-    def mock_dependencies(self):
-        """Create all mocked dependencies."""
-        github_client = Mock()
-        mapper_factory = Mock()
-        repository = Mock()
-        reporter = Mock()
-        config = Config()
-        return {
-            "github_client": github_client,
-            "mapper_factory": mapper_factory,
-            "repository": repository,
-            "reporter": reporter,
-            "config": config,
-        }
-
-    @pytest.fixture
-    def service(self, mock_dependencies):
-        """Create service with mocked dependencies."""
-        return SBOMFetcherService(**mock_dependencies)
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock requests session."""
-        return Mock()
-
-    @patch("sbom_fetcher.services.sbom_service.save_root_sbom")
-    @patch("sbom_fetcher.services.sbom_service.time.sleep")
     def test_component_count_with_slash_in_branch_name(
-        self, mock_sleep, mock_save, service, mock_session, mock_dependencies, tmp_path
+        self, service, mock_session, mock_dependencies
     ):
-        """Test component counting works when branch name contains slashes."""
+        """Test the sanitized file name and count recorded by the client reach the report."""
         root_sbom = {"packages": [{"name": "test"}]}
         mock_dependencies["github_client"].fetch_root_sbom.return_value = root_sbom
 
@@ -405,34 +387,21 @@ class TestBranchNameSanitization:
             github_repository=GitHubRepository(owner="cdklabs", repo="awscdk-asset-awscli"),
         )
 
+        def download(session, dep, output_dir):
+            dep.sbom_file = "cdklabs_awscdk-asset-awscli_awscli-v1_main.json"
+            dep.sbom_component_count = 2
+            return True
+
         with patch.object(service._parser, "extract_packages", return_value=[pkg]):
             mock_dependencies["mapper_factory"].map_package_to_github.return_value = True
-            mock_dependencies["github_client"].download_dependency_sbom.return_value = True
-            # Return branch with slash
-            mock_dependencies["github_client"].get_default_branch.return_value = "awscli-v1/main"
+            mock_dependencies["github_client"].download_dependency_sbom.side_effect = download
             mock_dependencies["reporter"].generate.return_value = "report.md"
 
-            # Patch Path to use real tmp_path for deps_dir
-            with patch("sbom_fetcher.services.sbom_service.Path") as mock_path:
-                mock_output_base = Mock()
-                mock_output_base.mkdir = Mock()
-                mock_output_base.__str__ = Mock(return_value=str(tmp_path))
-                mock_output_base.__truediv__ = Mock(side_effect=lambda x: tmp_path / x)
-
-                mock_deps_dir = tmp_path / "dependencies"
-                mock_deps_dir.mkdir(parents=True, exist_ok=True)
-
-                # Create SBOM file with sanitized name (slash -> underscore)
-                sanitized_sbom_file = (
-                    mock_deps_dir / "cdklabs_awscdk-asset-awscli_awscli-v1_main.json"
-                )
-                with open(sanitized_sbom_file, "w", encoding="utf-8") as f:
-                    json.dump({"packages": [{"name": "dep1"}, {"name": "dep2"}]}, f)
-
-                mock_path.return_value = mock_output_base
-
-                with patch("builtins.open", mock_open()):
-                    with patch("sbom_fetcher.services.sbom_service.json.dump"):
-                        result = service.fetch_all_sboms("owner", "repo", mock_session)
+            result = service.fetch_all_sboms("owner", "repo", mock_session)
 
         assert result.stats.sboms_downloaded == 1
+        mapping = mock_dependencies["reporter"].generate.call_args.args[5]
+        entry = mapping["cdklabs/awscdk-asset-awscli"]
+        assert entry["sbom_file"] == "cdklabs_awscdk-asset-awscli_awscli-v1_main.json"
+        assert entry["component_count"] == 2
+        mock_dependencies["github_client"].get_default_branch.assert_not_called()
@@ -3,7 +3,6 @@
 # Note: Lines 153, 163, 232, 261, 281 in sbom_service.py are edge cases
 # that are difficult to test in isolation:
 # - Line 153: Mapping progress logging (only triggers at i % 20)
-# - Line 163: Rate limiting sleep (only triggers at i % 10)
 # - Line 232: Component counting success path (covered by integration tests)
 # - Line 261, 281: Rate limiting in downloads (covered by integration tests)
 #